@@ -0,0 +1,75 @@
+"""Benchmark :class:`modeled.member` value accessors.
+
+Compares getting and setting member values
+via the generated specialized accessors
+with the general :class:`modeled.member` accessors
+and with plain attribute access of non-modeled objects.
+
+Usage::
+
+    python benchmark/accessors.py [<number of iterations>]
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from __future__ import print_function
+
+import sys
+from timeit import timeit
+
+from modeled import mobject, member, m
+
+
+class Plain(object):
+    def __init__(self):
+        self.value = 0
+
+
+class Modeled(mobject):
+    value = m[int](0)
+
+
+class CompactModeled(mobject):
+    class model:
+        slots = True
+
+    value = m[int](0)
+
+
+def main(number=1000000):
+    plain = Plain()
+    modeled = Modeled()
+    compact = CompactModeled()
+    general_get = member.__get__
+    general_set = member.__set__
+    cases = [
+      ("plain attribute", {
+        'get': lambda: plain.value,
+        'set': lambda: setattr(plain, 'value', 1),
+        }),
+      ("general member", {
+        'get': lambda: general_get(Modeled.value, modeled, Modeled),
+        'set': lambda: general_set(Modeled.value, modeled, 1),
+        }),
+      ("specialized member", {
+        'get': lambda: modeled.value,
+        'set': lambda: setattr(modeled, 'value', 1),
+        }),
+      ("general slots member", {
+        'get': lambda: general_get(
+          CompactModeled.value, compact, CompactModeled),
+        'set': lambda: general_set(CompactModeled.value, compact, 1),
+        }),
+      ("specialized slots member", {
+        'get': lambda: compact.value,
+        'set': lambda: setattr(compact, 'value', 1),
+        }),
+      ]
+    print("%d iterations (ns per access):" % number)
+    for title, funcs in cases:
+        print("  %-26s get: %7.1f  set: %7.1f" % ((title, ) + tuple(
+          timeit(funcs[op], number=number) / number * 1e9
+          for op in ['get', 'set'])))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
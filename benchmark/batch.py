@@ -0,0 +1,62 @@
+"""Benchmark batch creation of :class:`modeled.object` instances.
+
+Compares ``<modeled class>.model.build_many()``
+with calling the modeled class constructor for each row,
+for growing numbers of rows to show linear scaling.
+
+Usage::
+
+    python benchmark/batch.py [<max number of rows>]
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from __future__ import print_function
+
+import gc
+import sys
+from timeit import default_timer
+
+from modeled import mobject, m
+
+
+class Record(mobject):
+    id = m[int](0)
+    price = m[float](0.0)
+    name = m[str]('')
+    active = m[bool](False)
+
+
+COLUMNS = ['id', 'price', 'name', 'active']
+
+
+def timed(func, *args):
+    # like timeit, exclude garbage collection runs,
+    # which grow with the number of instances created before
+    gc.collect()
+    gc.disable()
+    try:
+        start = default_timer()
+        func(*args)
+        return default_timer() - start
+    finally:
+        gc.enable()
+
+
+def main(maxcount=100000):
+    print("rows/s for modeled class with 4 members:")
+    print("  %10s %14s %14s %14s" % (
+      "rows", "constructor", "build_many", "(dict rows)"))
+    count = 1000
+    while count <= maxcount:
+        rows = [(i, '1.5', 'name', 1) for i in range(count)]
+        dictrows = [dict(zip(COLUMNS, row)) for row in rows]
+        single = timed(lambda: [Record(**row) for row in dictrows])
+        batch = timed(Record.model.build_many, rows, COLUMNS)
+        dictbatch = timed(Record.model.build_many, dictrows)
+        print("  %10d %14.0f %14.0f %14.0f" % (
+          count, count / single, count / batch, count / dictbatch))
+        count *= 10
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
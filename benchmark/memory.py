@@ -0,0 +1,63 @@
+"""Benchmark memory usage of :class:`modeled.object` instances.
+
+Compares the bytes per instance of the default instancemember based
+member value storage with the compact storage in __slots__,
+enabled by the ``slots`` model option.
+
+Usage::
+
+    python benchmark/memory.py [<number of instances>]
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from __future__ import print_function
+
+import sys
+import gc
+import tracemalloc
+
+from modeled import mobject, m
+
+
+class Record(mobject):
+    id = m[int](0)
+    price = m[float](0.0)
+    name = m[str]('')
+    active = m[bool](False)
+
+
+class CompactRecord(mobject):
+    class model:
+        slots = True
+
+    id = m[int](0)
+    price = m[float](0.0)
+    name = m[str]('')
+    active = m[bool](False)
+
+
+def bytes_per_instance(mclass, count):
+    """Get the average number of allocated bytes
+       per instance of `mclass` when creating `count` instances.
+    """
+    gc.collect()
+    tracemalloc.start()
+    instances = [mclass(id=i, price=1.5, name='name', active=True)
+                 for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return float(size) / count
+
+
+def main(count=10000):
+    default = bytes_per_instance(Record, count)
+    compact = bytes_per_instance(CompactRecord, count)
+    print("%d instances with 4 members each:" % count)
+    print("  instancemember storage: %8.1f bytes/instance" % default)
+    print("  __slots__ storage:      %8.1f bytes/instance" % compact)
+    print("  ratio:                  %8.2fx" % (default / compact))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
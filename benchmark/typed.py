@@ -0,0 +1,48 @@
+"""Benchmark the per-call overhead of :func:`modeled.typed` wrappers.
+
+Compares calls of undecorated functions
+with calls of the compiled typed() wrappers,
+for args already of their mtypes and for args needing conversion.
+
+Usage::
+
+    python benchmark/typed.py [<number of calls>]
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from __future__ import print_function
+
+import sys
+from timeit import timeit
+
+from modeled import typed
+
+
+def plain(x, y, scale=1.0):
+    return x * y * scale
+
+
+@typed(argtypes={'x': float, 'y': float, 'scale': float},
+       returntype=float)
+def converted(x, y, scale=1.0):
+    return x * y * scale
+
+
+def main(number=1000000):
+    cases = [
+      ("undecorated", lambda: plain(2.0, 3.0)),
+      ("typed, no conversion", lambda: converted(2.0, 3.0)),
+      ("typed, keyword args", lambda: converted(x=2.0, y=3.0, scale=2.0)),
+      ("typed, int conversion", lambda: converted(2, 3)),
+      ]
+    print("ns per call (%d calls):" % number)
+    baseline = None
+    for title, func in cases:
+        ns = timeit(func, number=number) * 1e9 / number
+        if baseline is None:
+            baseline = ns
+        print("  %-24s %8.1f  (+%.1f)" % (title, ns, ns - baseline))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
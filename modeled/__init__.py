@@ -48,7 +48,7 @@ ismdict = ismodeleddict
 from .range import range
 mrange = range
 
-from .datetime import datetime
+from .datetime import datetime, months, years
 mdatetime = datetime
 
 from .namedtuple import namedtuple
@@ -67,7 +67,7 @@ M = mobject = object
 
 from .member import (
     MembersDict, MemberError, member,
-    InstanceMembersDict, instancemember,
+    InstanceMembersDict, instancemember, batch,
     ismodeledmemberclass, ismodeledmember, ismodeledinstancemember,
     getmodeledmembers,
 )
@@ -79,6 +79,11 @@ from .property import (
 )
 mproperty = property
 
+from .table import table, ismodeledtableclass, ismodeledtable
+mtable = table
+ismtableclass = ismodeledtableclass
+ismtable = ismodeledtable
+
 from .typed import typed
 
 from .cfunc import (
@@ -28,14 +28,11 @@ __all__ = [
   # from .arg:
   'CFuncArgError', 'ismodeledcfuncarg', 'getmodeledcfuncargs']
 
-import ctypes
-from ctypes import _Pointer, byref
-# Get byref type with dummy expression:
-_Ref = type(byref(ctypes.c_int()))
-
 from modeled.object import object as mobject
 
 from .model import Model
+from .plan import CallPlan, MISSING
+from .buffer import buffer
 from .arg import CFuncArgError, arg, ismodeledcfuncarg, getmodeledcfuncargs
 
 
@@ -52,11 +49,32 @@ class Type(mobject.meta):
 
     arg = arg # modeled.cfunc.arg class
 
+    buffer = buffer # modeled.cfunc.buffer class
+
     def __init__(cls, clsname, bases, clsattrs):
         mobject.meta.__init__(cls, clsname, bases, clsattrs)
         if cls.model.members:
             cls.model.cfunc.argtypes = [
               m.ctype for (name, m) in cls.model.members]
+            cls.model.callplan = CallPlan(cls.model)
+
+    def call(cls, *args, **kwargs):
+        """Lightweight call of the C function
+           without creating a modeled.cfunc instance.
+
+        - Returns a tuple of the result and the out-param values.
+        """
+        return cls.model.callplan.call(args, kwargs)
+
+    def map(cls, *columns, **options):
+        """Call the C function for all rows of arg value `columns`
+           without creating modeled.cfunc instances.
+
+        - Options: array=False, executor=None, chunksize=None
+          (see :meth:`modeled.cfunc.plan.CallPlan.map`)
+        - Returns a tuple of the result column and the out-param columns.
+        """
+        return cls.model.callplan.map(columns, **options)
 
     def __getitem__(cls, restype_and_cfunc):
         try:
@@ -81,35 +99,24 @@ class cfunc(with_metaclass(Type, mobject)):
       based on the modeled.cfunc.arg member definitions.
     """
     def __init__(self, *args, **membervalues):
-        for arg, (name, _) in zip(args, self.model.args):
+        plan = self.model.callplan
+        for arg, name in zip(args, plan.names):
             membervalues[name] = arg
         mobject.__init__(self, **membervalues)
 
-        cfunc = self.model.cfunc
-        args = []
-        for (name, _), argtype in zip(self.model.args, cfunc.argtypes):
+        values = []
+        for name in plan.names:
             try:
-                value = getattr(self, name)
-            except CFuncArgError as e:
-                argexc = e
-            if issubclass(argtype, _Pointer):
-                try:
-                    cvalue = argtype._type_(value)
-                except NameError: # No value
-                    cvalue = argtype._type_()
-                arg = byref(cvalue)
-            else:
-                try:
-                    arg = argtype(value)
-                except NameError: # No value
-                    raise argexc
-            args.append(arg)
-        self.resvalue = self.model.cfunc(*args)
-        if self.model.restype:
-            self.resvalue = self.model.restype(self.resvalue)
-        for arg, (name, _) in zip(args, self.model.args):
-            if isinstance(arg, _Ref):
-                setattr(self, name, arg._obj.value)
+                values.append(getattr(self, name))
+            except CFuncArgError:
+                values.append(MISSING)
+        # member values are already converted
+        cargs, outvalues = plan.marshal(values, convert=False)
+        self.resvalue = plan.cfunc(*cargs)
+        if plan.restype:
+            self.resvalue = plan.restype(self.resvalue)
+        for index, cvalue in zip(plan.outs, outvalues):
+            setattr(self, plan.names[index], cvalue.value)
 
 
 def ismodeledcfuncclass(cls):
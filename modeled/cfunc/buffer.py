@@ -0,0 +1,118 @@
+# python-modeled
+#
+# Copyright (C) 2014 Stefan Zimmermann <zimmermann.code@gmail.com>
+#
+# python-modeled is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# python-modeled is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with python-modeled.  If not, see <http://www.gnu.org/licenses/>.
+
+"""modeled.cfunc.buffer
+
+Zero-copy buffer args for modeled.cfunc.
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+__all__ = ['buffer', 'outbuffer']
+
+import sys
+from ctypes import POINTER, sizeof
+
+#: The byte order char of native buffer formats
+NATIVE = '<' if sys.byteorder == 'little' else '>'
+
+#: Buffer formats of raw memory, which can be passed as any ctype
+RAW_FORMATS = ('B', 'b', 'c')
+
+#: Kinds of buffer format and ctype codes, which must match
+KINDS = dict(
+  [(code, 'i') for code in 'bhilqn'] +
+  [(code, 'u') for code in 'BHILQN'] +
+  [(code, 'f') for code in 'efd'] +
+  [('?', '?')])
+
+
+class buffer(object):
+    """Wrapper of a buffer protocol object
+       (NumPy array, bytearray, memoryview, mmap, ...)
+       as mtype of :class:`modeled.cfunc.arg` POINTER args,
+       which are then passed to the C function without copying.
+
+    - The buffer must be C contiguous
+      and its format must match the POINTER's ctype
+      (or be raw bytes of a multiple of the ctype's size).
+    - Use :class:`outbuffer` (or buffer.out)
+      for buffers written by the C function.
+    """
+    __module__ = 'modeled'
+
+    #: Does the C function only read from the buffer?
+    readonly = True
+
+    def __init__(self, obj):
+        self.obj = obj
+        view = memoryview(obj)
+        if not view.c_contiguous:
+            raise BufferError("%s needs a C contiguous buffer." % (
+              type(self).__name__))
+        if view.readonly and not self.readonly:
+            raise BufferError("%s needs a writable buffer." % (
+              type(self).__name__))
+
+    def pointer(self, ctype):
+        """Get a zero-copy pointer to the buffer data as `ctype` array.
+
+        - Read-only buffers, which are no NumPy arrays (like bytes),
+          can't be referenced by ctypes and are copied.
+        """
+        view = memoryview(self.obj)
+        size = sizeof(ctype)
+        format = view.format
+        if format[:1] in '<>!':
+            if format[0] != NATIVE:
+                raise BufferError("Buffer has non-native byte order: %s"
+                                  % repr(format))
+            format = format[1:]
+        format = format.lstrip('@=')
+        if format in RAW_FORMATS:
+            if view.nbytes % size:
+                raise BufferError(
+                  "Buffer size %d is no multiple of %s size %d."
+                  % (view.nbytes, ctype.__name__, size))
+        elif view.itemsize != size \
+          or KINDS.get(format) != KINDS.get(ctype._type_):
+            raise BufferError("Buffer format %s doesn't match %s." % (
+              repr(view.format), ctype.__name__))
+
+        if hasattr(self.obj, '__array_interface__') \
+          and hasattr(self.obj, 'ctypes'):  # NumPy array
+            return self.obj.ctypes.data_as(POINTER(ctype))
+
+        arraytype = ctype * (view.nbytes // size)
+        if view.readonly:
+            return arraytype.from_buffer_copy(view)
+        return arraytype.from_buffer(self.obj)
+
+    def __repr__(self):
+        return 'modeled.cfunc.%s(%s)' % (type(self).__name__, repr(self.obj))
+
+
+class outbuffer(buffer):
+    """Wrapper of a writable buffer protocol object
+       as mtype of :class:`modeled.cfunc.arg` POINTER args,
+       which the C function writes to in place.
+    """
+    __module__ = 'modeled'
+
+    readonly = False
+
+
+buffer.out = outbuffer
@@ -0,0 +1,239 @@
+# python-modeled
+#
+# Copyright (C) 2014 Stefan Zimmermann <zimmermann.code@gmail.com>
+#
+# python-modeled is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# python-modeled is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with python-modeled.  If not, see <http://www.gnu.org/licenses/>.
+
+"""modeled.cfunc.plan
+
+Precomputed argument marshalling for modeled.cfunc calls.
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+__all__ = ['CallPlan', 'MISSING']
+
+from collections import namedtuple
+from ctypes import _Pointer, byref, sizeof
+from multiprocessing import cpu_count
+
+from six.moves import xrange
+
+import modeled
+from .buffer import buffer
+
+#: Marks arg values, which were not given and have no default
+MISSING = object()
+
+
+Slot = namedtuple('Slot', 'name member ctype pointer buffered default')
+
+
+class CallPlan(object):
+    """The argument marshalling plan of a :class:`modeled.cfunc` class.
+
+    - Created once per class by :class:`modeled.cfunc.type`.
+    - Holds a slot per C function arg with its ctype (the pointed-to type
+      for POINTER args, which are passed byref as out-params
+      or as zero-copy pointers into :class:`modeled.cfunc.buffer` values)
+      and the member default.
+    """
+    def __init__(self, model):
+        self.cfunc = model.cfunc
+        self.restype = getattr(model, 'restype', None)
+        self.slots = []
+        self.outs = []
+        for index, ((name, m), argtype) in enumerate(
+          zip(model.args, self.cfunc.argtypes)):
+            pointer = issubclass(argtype, _Pointer)
+            buffered = pointer and issubclass(m.mtype, buffer)
+            if pointer and not buffered:
+                self.outs.append(index)
+            self.slots.append(Slot(
+              name, m, argtype._type_ if pointer else argtype, pointer,
+              buffered, getattr(m, 'default', MISSING)))
+        self.names = [slot.name for slot in self.slots]
+        self.positions = dict(
+          (name, index) for index, name in enumerate(self.names))
+
+    def bind(self, args, kwargs):
+        """Get the list of arg values in C arg order
+           from positional `args` and keyword `kwargs`.
+
+        - Unset args are marked with :data:`MISSING`.
+        """
+        count = len(self.names)
+        if len(args) > count:
+            raise TypeError("%s takes at most %d args (%d given)" % (
+              self.cfunc.__name__, count, len(args)))
+        values = list(args) + [MISSING] * (count - len(args))
+        for name, value in kwargs.items():
+            try:
+                values[self.positions[name]] = value
+            except KeyError:
+                raise TypeError("%s got an unknown arg %s" % (
+                  self.cfunc.__name__, repr(name)))
+        return values
+
+    def marshal(self, values, convert=True):
+        """Get the list of C args for given arg `values`
+           and the list of ctypes objects passed as out-params.
+
+        - Optionally `convert`s the values via their members first.
+        """
+        cargs = []
+        outvalues = []
+        for value, slot in zip(values, self.slots):
+            if value is MISSING:
+                value = slot.default
+            elif convert:
+                value = slot.member.convert(value)
+            if slot.buffered:
+                if value is MISSING:
+                    raise type(slot.member).error(
+                      "'%s' has no default value." % slot.name)
+                cargs.append(value.pointer(slot.ctype))
+            elif slot.pointer:
+                cvalue = slot.ctype() if value is MISSING \
+                  else slot.ctype(value)
+                outvalues.append(cvalue)
+                cargs.append(byref(cvalue))
+            elif value is MISSING:
+                raise type(slot.member).error(
+                  "'%s' has no default value." % slot.name)
+            else:  # converted by ctypes via cfunc.argtypes
+                cargs.append(value)
+        return cargs, outvalues
+
+    def call(self, args, kwargs):
+        """Call the C function with positional `args` and keyword `kwargs`.
+
+        - Returns a tuple of the result and the out-param values.
+        """
+        cargs, outvalues = self.marshal(self.bind(args, kwargs))
+        result = self.cfunc(*cargs)
+        if self.restype:
+            result = self.restype(result)
+        return (result, ) + tuple(
+          self.outvalue(index, cvalue.value)
+          for index, cvalue in zip(self.outs, outvalues))
+
+    def outvalue(self, index, value):
+        """Convert an out-param `value` of the arg at `index`
+           to its member data type.
+        """
+        mtype = self.slots[index].member.mtype
+        return value if isinstance(value, mtype) else mtype(value)
+
+    def map(self, columns, array=False, executor=None, chunksize=None):
+        """Call the C function for all rows of arg value `columns`.
+
+        - Columns (sequences or NumPy arrays) are given in C arg order.
+          Missing trailing columns use the arg defaults.
+          Columns for out-params provide initial values.
+        - Each column is converted at once to a ctypes array,
+          and out-params are written to preallocated ctypes arrays.
+        - Optionally distributes chunks of rows
+          to a :mod:`concurrent.futures` `executor`.
+        - Returns a tuple of the result column and the out-param columns,
+          either as :class:`modeled.list` instances
+          or as NumPy arrays if `array` is True.
+        """
+        if len(columns) > len(self.slots):
+            raise TypeError("%s takes at most %d arg columns (%d given)" % (
+              self.cfunc.__name__, len(self.slots), len(columns)))
+        columns = [c if hasattr(c, '__len__') else list(c) for c in columns]
+        count = min(len(c) for c in columns) if columns else 0
+        buffers = [
+          self.buffer(slot, columns[index] if index < len(columns) else None,
+                      count)
+          for index, slot in enumerate(self.slots)]
+        # out-params get byref()s of ctypes objects sharing the memory
+        #  of their preallocated buffer elements
+        getters = [
+          (lambda i, buf=buf, ctype=slot.ctype, size=sizeof(slot.ctype):
+           byref(ctype.from_buffer(buf, i * size)))
+          if slot.pointer and not slot.buffered else buf.__getitem__
+          for buf, slot in zip(buffers, self.slots)]
+        cfunc, restype = self.cfunc, self.restype
+        results = [None] * count
+
+        def run(start, stop):
+            for i in xrange(start, stop):
+                result = cfunc(*[get(i) for get in getters])
+                results[i] = restype(result) if restype else result
+
+        if executor is None:
+            run(0, count)
+        else:
+            if not chunksize:
+                chunksize = max(1, count // (4 * (cpu_count() or 1)))
+            futures = [executor.submit(run, start, min(start + chunksize,
+                                                       count))
+                       for start in xrange(0, count, chunksize)]
+            for future in futures:
+                future.result()
+
+        outbuffers = [buffers[index] for index in self.outs]
+        if array:
+            import numpy
+            return (numpy.array(results), ) + tuple(
+              numpy.ctypeslib.as_array(buf) for buf in outbuffers)
+
+        return (modeled.list(results) if results else [], ) + tuple(
+          modeled.list[self.slots[index].member.mtype](buf)
+          for index, buf in zip(self.outs, outbuffers))
+
+    def buffer(self, slot, column, count):
+        """Convert a `column` of arg values for `slot` at once
+           to a ctypes array of length `count`.
+
+        - If `column` is None, the array is filled with the arg default
+          (or zero-initialized for out-params).
+        - Columns of buffer args become lists of buffer pointers.
+        """
+        if slot.buffered:  # ==> list of zero-copy pointers
+            if column is None:
+                raise type(slot.member).error(
+                  "'%s' has no default value." % slot.name)
+            return [slot.member.convert(value).pointer(slot.ctype)
+                    for value in column[:count]]
+
+        arraytype = slot.ctype * count
+        if column is None:
+            if slot.default is not MISSING:
+                return arraytype(*([slot.default] * count))
+            if slot.pointer:
+                return arraytype()
+            raise type(slot.member).error(
+              "'%s' has no default value." % slot.name)
+
+        if hasattr(column, '__array_interface__'):  # NumPy array
+            import numpy
+            try:
+                dtype = numpy.dtype(slot.ctype)
+            except TypeError:  # no NumPy equivalent
+                column = column[:count].tolist()
+            else:
+                if slot.member.choices:  # only check the distinct values
+                    slot.member.checkchoices(
+                      numpy.unique(column[:count]).tolist())
+                return arraytype.from_buffer_copy(numpy.ascontiguousarray(
+                  column[:count], dtype=dtype))
+
+        values = column[:count]
+        slot.member.checkchoices(values)
+        try:
+            return arraytype(*values)
+        except TypeError:
+            return arraytype(*[slot.member.convert(v) for v in values])
@@ -22,25 +22,110 @@ The modeled.datetime (mdatetime) class.
 .. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
 """
 from __future__ import absolute_import
-from six import with_metaclass
+from six import with_metaclass, exec_
 
-__all__ = ['datetime']
+__all__ = ['datetime', 'months', 'years']
 
+import re
+from calendar import monthrange
 from datetime import datetime as base
 
-from moretools import isstring
+from moretools import cached, isstring
+
+#: The fixed-width format directives supported by compiled parsers
+FIXED_WIDTHS = {
+  'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2,
+  }
+
+#: The datetime fields in (base class) constructor argument order
+FIELDS = 'YmdHMS'
+
+#: The values of fields missing in a format (the same as strptime uses)
+DEFAULTS = {'Y': '1900', 'm': '1', 'd': '1'}
+
+
+def parser(format):
+    """Compile a parser function for datetime strings in given `format`,
+       which returns datetime constructor args.
+
+    - Formats consisting only of fixed-width %Y %m %d %H %M %S directives
+      and literal characters, optionally ending with a variable width %f,
+      are parsed by string slicing and int conversion.
+    - Other formats and strings not matching the fixed widths
+      (like non zero-padded numbers) fall back to strptime.
+    """
+    def strptime(string):
+        dt = base.strptime(string, format)
+        return (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second,
+                dt.microsecond, dt.tzinfo)
+
+    tokens = re.findall(r'%.|[^%]', format)
+    fraction = tokens[-1:] == ['%f']
+    if fraction:
+        tokens.pop()
+    slices = {}
+    literals = []
+    pos = 0
+    for token in tokens:
+        if token == '%%':
+            token = '%'
+        elif token.startswith('%'):
+            field = token[1]
+            width = FIXED_WIDTHS.get(field)
+            if not width or field in slices:
+                return strptime
+
+            slices[field] = 'string[%d:%d]' % (pos, pos + width)
+            pos += width
+            continue
+
+        literals.append('string[%d] == %s' % (pos, repr(token)))
+        pos += 1
+    if not slices:
+        return strptime
+
+    digits = ' + '.join(slices[field] for field in FIELDS
+                        if field in slices)
+    args = ', '.join('int(%s)' % slices[field] if field in slices
+                     else DEFAULTS.get(field, '0')
+                     for field in FIELDS)
+    if fraction:
+        length = 'len(string) - %d in (1, 2, 3, 4, 5, 6)' % pos
+        digits += ' + string[%d:]' % pos
+        args += ', int(string[%d:].ljust(6, "0"))' % pos
+    else:
+        length = 'len(string) == %d' % pos
+    source = '\n'.join([
+      "def parse(string):",
+      "    if %s and (%s).isdigit()%s:" % (
+        length, digits, ''.join(' and ' + c for c in literals)),
+      "        return (%s)" % args,
+      "    return strptime(string)",
+      ])
+    namespace = {'strptime': strptime}
+    exec_(source, namespace)
+    parse = namespace['parse']
+    parse.__doc__ = "Parse a datetime string in %s format." % repr(format)
+    return parse
 
 
 class Meta(type(base)):
     """Metaclass for :class:`modeled.datetime`.
+
+    - Compiles a :func:`parser` for the class-bound format.
     """
-    def __getitem__(cls, format):
-        class subclass(cls):
-            pass
+    def __init__(cls, clsname, bases, clsattrs):
+        type(base).__init__(cls, clsname, bases, clsattrs)
+        if 'parse' not in clsattrs:
+            cls.parse = staticmethod(parser(cls.format))
 
-        subclass.format = format = str(format)
-        subclass.__name__ = subclass.__qualname__ = '%s[%s]' % (
-          cls.__name__, repr(format))
+    @cached
+    def __getitem__(cls, format):
+        format = str(format)
+        return type(cls)('%s[%s]' % (cls.__name__, repr(format)), (cls, ), {
+          '__module__': cls.__module__,
+          'format': format,
+          })
 
 
 class datetime(with_metaclass(Meta, base)):
@@ -62,7 +147,82 @@ class datetime(with_metaclass(Meta, base)):
            by giving either a 
         """
         if isstring(string_or_year):
-            dt = base.strptime(string_or_year, cls.format)
-            return base.__new__(cls, *dt.timetuple()[:6])
+            return base.__new__(cls, *cls.parse(string_or_year))
+
+        if isinstance(string_or_year, base):
+            dt = string_or_year
+            return base.__new__(
+              cls, dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second,
+              dt.microsecond, dt.tzinfo)
 
         return base.__new__(cls, string_or_year, *mdhms)
+
+    @classmethod
+    def parse_many(cls, strings, array=False):
+        """Parse a sequence of datetime `strings` in the class-bound format.
+
+        - Returns a list of class instances
+          or a NumPy datetime64[us] array if `array` is True.
+        """
+        new, parse = base.__new__, cls.parse
+        items = [new(cls, *parse(string)) for string in strings]
+        if array:
+            import numpy
+            return numpy.array(items, dtype='datetime64[us]')
+        return items
+
+
+class months(object):
+    """A calendar-aware step of `count` months,
+       which can be added to dates and datetimes
+       and used as :class:`modeled.range` step.
+
+    - Days beyond the end of the resulting month
+      are clipped to its last day.
+    """
+    def __init__(self, count=1):
+        self.count = count
+
+    def __radd__(self, dt):
+        year, month = divmod(dt.month - 1 + self.count, 12)
+        year += dt.year
+        month += 1
+        return dt.replace(year=year, month=month,
+                          day=min(dt.day, monthrange(year, month)[1]))
+
+    def __mul__(self, factor):
+        return months(self.count * factor)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return months(-self.count)
+
+    def __bool__(self):
+        return bool(self.count)
+
+    __nonzero__ = __bool__
+
+    def __lt__(self, other):
+        return self.count < other.count
+
+    def __gt__(self, other):
+        return self.count > other.count
+
+    def __eq__(self, other):
+        return isinstance(other, months) and self.count == other.count
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((months, self.count))
+
+    def __repr__(self):
+        return 'modeled.months(%s)' % repr(self.count)
+
+
+def years(count=1):
+    """A calendar-aware step of `count` years.
+    """
+    return months(12 * count)
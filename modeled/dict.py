@@ -25,6 +25,8 @@ __all__ = ['dict', 'ismodeleddictclass', 'ismodeleddict']
 
 from six.moves import builtins
 
+from itertools import chain
+
 from moretools import cached
 
 import modeled
@@ -70,18 +72,19 @@ class dict(with_metaclass(Type, typed.base, builtins.dict)):
     def valuetype(self):
         return self.mtype.mtypes[1]
 
-    def __init__(self, iterable=()):
-        items = iter(iterable)
+    def __init__(self, iterable=(), **kwargs):
         try:
             self.mtype
         except AttributeError:
+            items = chain(pairs(iterable), kwargs.items())
             try:
                 key, value = next(items)
             except StopIteration:
                 raise TypeError
             self.__class__ = type(self)[type(key), type(value)]
             self[key] = value
-        self.update(items)
+            iterable, kwargs = items, {}
+        self.update(iterable, **kwargs)
 
     def __setitem__(self, key, value):
         if not isinstance(key, self.keytype):
@@ -90,16 +93,85 @@ class dict(with_metaclass(Type, typed.base, builtins.dict)):
             value = self.valuetype(value)
         builtins.dict.__setitem__(self, key, value)
 
-    def update(self, iterable):
-        def items():
-            for key, value in iterable:
-                if isinstance(key, self.keytype):
-                    key = self.keytype(key)
-                if isinstance(value, self.valuetype):
-                    value = self.valuetype(value)
-                yield (key, value)
-
-        builtins.dict.update(self, items())
+    def coerce(self, iterable):
+        """Get the (key, value) pairs of a mapping or pair `iterable`
+           converted to key and value types.
+
+        - Returns `iterable` itself if already a modeled.dict
+          with the same (or derived) key and value types,
+          to skip conversion.
+        """
+        keytype, valuetype = self.keytype, self.valuetype
+        if isinstance(iterable, dict) \
+          and issubclass(iterable.keytype, keytype) \
+          and issubclass(iterable.valuetype, valuetype):
+            return iterable
+        return ((key if isinstance(key, keytype) else keytype(key),
+                 value if isinstance(value, valuetype) else valuetype(value))
+                for key, value in pairs(iterable))
+
+    def update(self, iterable=(), **kwargs):
+        builtins.dict.update(self, self.coerce(iterable))
+        if kwargs:
+            builtins.dict.update(self, self.coerce(kwargs))
+
+    def setdefault(self, key, default=None):
+        if not isinstance(key, self.keytype):
+            key = self.keytype(key)
+        try:
+            return builtins.dict.__getitem__(self, key)
+        except KeyError:
+            if not isinstance(default, self.valuetype):
+                default = self.valuetype(default)
+            builtins.dict.__setitem__(self, key, default)
+            return default
+
+    @classmethod
+    def fromkeys(cls, keys, value=None):
+        new = cls()
+        keytype, valuetype = cls.keytype, cls.valuetype
+        # None is converted like in all other typed paths
+        if not isinstance(value, valuetype):
+            value = valuetype(value)
+        builtins.dict.update(new, (
+            (key if isinstance(key, keytype) else keytype(key), value)
+            for key in keys))
+        return new
+
+    def copy(self):
+        new = builtins.dict.__new__(type(self))
+        builtins.dict.update(new, self)
+        return new
+
+    def __or__(self, other):
+        if not isinstance(other, builtins.dict):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other):
+        if not isinstance(other, builtins.dict):
+            return NotImplemented
+        new = builtins.dict.__new__(type(self))
+        builtins.dict.update(new, self.coerce(other))
+        builtins.dict.update(new, self)
+        return new
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+def pairs(iterable):
+    """Get (key, value) pairs from a mapping or pair `iterable`.
+    """
+    if hasattr(iterable, 'keys'):
+        try:
+            return iter(iterable.items())
+        except AttributeError:
+            return ((key, iterable[key]) for key in iterable.keys())
+    return iter(iterable)
 
 
 def ismodeleddictclass(cls):
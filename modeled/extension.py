@@ -43,6 +43,7 @@ class Members(ExtensionDeco):
         extdeco = Members(self.mclass, **mvalues)
         if extclass is not None:
             self.mclass.model.extensions[extclass] = extdeco
+            self.mclass.model.replan()
             return extclass
         return extdeco
 
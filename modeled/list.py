@@ -21,10 +21,21 @@
 """
 from six import with_metaclass
 from six.moves import builtins
+from array import array
+
+from moretools import cached
 
 from . import typed
 
-__all__ = ['list', 'ismodeledlistclass', 'ismodeledlist']
+__all__ = ['list', 'compactlist', 'ismodeledlistclass', 'ismodeledlist']
+
+
+# The array.array typecodes for compact storage of numeric item types.
+# (Python 2 has no 'q' typecode for long long)
+TYPECODES = {
+  int: 'q' if 'q' in getattr(array, 'typecodes', 'q') else 'l',
+  float: 'd',
+  }
 
 
 class meta(typed.base.type):
@@ -34,6 +45,13 @@ class meta(typed.base.type):
     def itemtype(cls):
         return cls.mtype
 
+    @property
+    def compact(cls):
+        """Get the array.array based compact list class
+           for the numeric item type of this typed list class.
+        """
+        return compactlist[cls.mtype]
+
 meta.__name__ = 'list.meta'
 
 
@@ -45,17 +63,39 @@ class list(with_metaclass(meta, typed.base, builtins.list)):
         return self.mtype
 
     def __init__(self, iterable=None):
-        items = iter(iterable if iterable is not None else ())
+        if iterable is None:
+            iterable = ()
         try:
             self.mtype
         except AttributeError:
+            items = iter(iterable)
             try:
                 first = next(items)
             except StopIteration:
                 raise TypeError
             self.__class__ = type(self)[type(first)]
             self.append(first)
-        self.extend(items)
+            iterable = items
+        self.extend(iterable)
+
+    def coerce(self, iterable):
+        """Get the items of `iterable` converted to the item type.
+
+        - Returns `iterable` itself if already a modeled.list
+          with the same (or a derived) item type, to skip conversion.
+        """
+        mtype = self.mtype
+        if isinstance(iterable, list) and issubclass(iterable.mtype, mtype):
+            return iterable
+        return (item if isinstance(item, mtype) else mtype(item)
+                for item in iterable)
+
+    def typed(self, items):
+        """Create a new list of the same type from already converted `items`.
+        """
+        new = builtins.list.__new__(type(self))
+        builtins.list.extend(new, items)
+        return new
 
     def append(self, item):
         if not isinstance(item, self.mtype):
@@ -63,14 +103,194 @@ class list(with_metaclass(meta, typed.base, builtins.list)):
         builtins.list.append(self, item)
 
     def extend(self, iterable):
-        def items():
-            for item in iterable:
-                if not isinstance(item, self.mtype):
-                    yield self.mtype(item)
-                else:
-                    yield item
-
-        builtins.list.extend(self, items())
+        builtins.list.extend(self, self.coerce(iterable))
+
+    def insert(self, index, item):
+        if not isinstance(item, self.mtype):
+            item = self.mtype(item)
+        builtins.list.insert(self, index, item)
+
+    def __getitem__(self, index):
+        items = builtins.list.__getitem__(self, index)
+        if isinstance(index, slice):
+            return self.typed(items)
+        return items
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = self.coerce(value)
+        elif not isinstance(value, self.mtype):
+            value = self.mtype(value)
+        builtins.list.__setitem__(self, index, value)
+
+    # Python 2 uses these for simple slices
+    def __getslice__(self, start, stop):
+        return self.__getitem__(slice(start, stop))
+
+    def __setslice__(self, start, stop, iterable):
+        self.__setitem__(slice(start, stop), iterable)
+
+    def __add__(self, other):
+        if not isinstance(other, builtins.list):
+            return NotImplemented
+        new = self.typed(self)
+        new.extend(other)
+        return new
+
+    def __radd__(self, other):
+        if not isinstance(other, builtins.list):
+            return NotImplemented
+        new = self.typed(self.coerce(other))
+        builtins.list.extend(new, self)
+        return new
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __mul__(self, count):
+        return self.typed(builtins.list.__mul__(self, count))
+
+    __rmul__ = __mul__
+
+    def copy(self):
+        return self.typed(self)
+
+
+class compactmeta(meta):
+    __module__ = 'modeled'
+
+    @cached
+    def __getitem__(cls, mtype):
+        try:
+            typecode = TYPECODES[mtype]
+        except KeyError:
+            raise TypeError("No compact modeled.list storage for %s items."
+                            % repr(mtype))
+
+        class typedcls(cls):
+            pass
+
+        typedcls.typecode = typecode
+        return meta.__getitem__(cls, mtype, typedcls)
+
+compactmeta.__name__ = 'list.compact.meta'
+
+
+class compactlist(with_metaclass(compactmeta, typed.base, array)):
+    """Compact typed list of numeric items, based on array.array.
+
+    - Created via modeled.list[<int or float>].compact
+    - Supports the buffer protocol for zero-copy access
+      (like with memoryview or numpy.frombuffer).
+    - Converts items from other arrays and buffers in bulk.
+    """
+    __module__ = 'modeled'
+
+    def __new__(cls, iterable=()):
+        try:
+            typecode = cls.typecode
+        except AttributeError:
+            raise TypeError(
+              "modeled.list.compact needs a numeric item type: "
+              "modeled.list[<int or float>].compact")
+        self = array.__new__(cls, typecode)
+        self.extend(iterable)
+        return self
+
+    @property
+    def itemtype(self):
+        return self.mtype
+
+    def append(self, item):
+        try: # let array.array do the conversion first
+            array.append(self, item)
+        except TypeError:
+            array.append(self, self.mtype(item))
+
+    def extend(self, iterable):
+        if isinstance(iterable, array):
+            if iterable.typecode == self.typecode:
+                array.extend(self, iterable)
+                return
+            iterable = iterable.tolist()
+        elif hasattr(iterable, '__array_interface__'): # ==> numpy array
+            import numpy
+            items = numpy.ascontiguousarray(iterable, dtype=self.typecode)
+            self.frombytes(memoryview(items).cast('B'))
+            return
+        else:
+            try:
+                view = memoryview(iterable)
+            except TypeError: # no buffer
+                if not isinstance(iterable, (builtins.list, builtins.tuple)):
+                    iterable = builtins.list(iterable)
+            else:
+                if view.format == self.typecode and view.c_contiguous:
+                    self.frombytes(view.cast('B'))
+                    return
+                iterable = view.tolist()
+        # let array.array convert all items at once, which only works
+        # if all items are compatible, otherwise convert per item
+        length = len(self)
+        try:
+            array.extend(self, iterable)
+        except TypeError:
+            del self[length:]
+            array.extend(self, (
+              item if isinstance(item, self.mtype) else self.mtype(item)
+              for item in iterable))
+
+    def insert(self, index, item):
+        try: # let array.array do the conversion first
+            array.insert(self, index, item)
+        except TypeError:
+            array.insert(self, index, self.mtype(item))
+
+    def __getitem__(self, index):
+        items = array.__getitem__(self, index)
+        if isinstance(index, slice):
+            return type(self)(items)
+        return items
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            if not (isinstance(value, array)
+                    and value.typecode == self.typecode):
+                value = type(self)(value)
+        else:
+            try: # let array.array do the conversion first
+                array.__setitem__(self, index, value)
+                return
+            except TypeError:
+                value = self.mtype(value)
+        array.__setitem__(self, index, value)
+
+    def __add__(self, other):
+        if not isinstance(other, (array, builtins.list)):
+            return NotImplemented
+        new = type(self)(self)
+        new.extend(other)
+        return new
+
+    def __radd__(self, other):
+        if not isinstance(other, (array, builtins.list)):
+            return NotImplemented
+        new = type(self)(other)
+        new.extend(self)
+        return new
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __mul__(self, count):
+        return type(self)(array.__mul__(self, count))
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return 'modeled.%s(%s)' % (type(self).__name__, self.tolist())
 
 
 def ismodeledlistclass(cls):
@@ -23,7 +23,7 @@ from six import with_metaclass
 
 __all__ = [
   'MembersDict', 'MemberError', 'member',
-  'InstanceMembersDict', 'instancemember',
+  'InstanceMembersDict', 'instancemember', 'batch',
   'ismodeledmemberclass', 'ismodeledmember',
   'ismodeledinstancemember',
   'getmodeledmembers']
@@ -40,7 +40,8 @@ from modeled.model import modelbase
 from modeled import typed
 
 from .handlers import Handlers
-from .context import context
+from .choices import Choices
+from .context import context, batch
 
 
 class MembersDictStructBase(simpledict.structbase):
@@ -114,7 +115,7 @@ class Type(typed.base.type):
                 class choicecls(cls):
                     pass
 
-            choicecls.choices = choices = builtins.list(choices)
+            choicecls.choices = choices = Choices(choices)
             choicecls.__module__ = cls.__module__
             choicecls.__name__ = '%s%s' % (cls.__name__, choices)
             return choicecls
@@ -130,6 +131,10 @@ class member(with_metaclass(Type, typed.base)):
     """
     __module__ = 'modeled'
 
+    # The value storing slot descriptor of the modeled class
+    # (assigned by modeled.meta.__init__ if `slots` model option is set):
+    slot = None
+
     def __init__(self, *default, **options):
         """Create a typed :class:`modeled.object` data member
            with an optional `default` value with implicit type.
@@ -170,6 +175,16 @@ class member(with_metaclass(Type, typed.base)):
             self.changed = Handlers()
         else:
             self.changed = Handlers(changed)
+        # Only store values and call hooks if different from current value?
+        # (If not given, the `changed_only_if_different` model option
+        #  will be used and assigned in modeled.object.type.__init__)
+        self.changed_only_if_different = options.pop(
+          'changed_only_if_different', None)
+        # The number of value assignments skipped for being unchanged:
+        self.suppressed = 0
+        # Track changes in model instances? (Enabled in modeled.meta.__init__
+        #  if any modeled class using this member has `dirty` model option)
+        self.tracked = False
         # If no explicit name is given, the associated class attribute name
         # will be used and assigned in modeled.object.type.__init__:
         self.name = options.pop('name', None)
@@ -179,18 +194,17 @@ class member(with_metaclass(Type, typed.base)):
             self.choices
         except AttributeError:
             choices = options.pop('choices', None)
-            self.choices = choices and builtins.list(choices)
+            self.choices = choices and Choices(choices)
         self.options = Options.frozen(options)
 
     def __get__(self, obj, owner=None):
-        """Get the current member value (stored in `obj.__dict__`).
+        """Get the current member value
+           (stored in `obj.__dict__` or in a slot of `obj`).
         """
         if obj is None: # ==> Accessed from modeled.object class level
             return self
-        # Get the instancemember for the given object...
-        im = obj.__dict__[self.name]
-        try: #... which acts as value storage:
-            return im._
+        try:
+            return self.load(obj)
         except AttributeError:
             try:
                 return self.default
@@ -199,11 +213,31 @@ class member(with_metaclass(Type, typed.base)):
                   "'%s' has no default value." % self.name)
 
     def __set__(self, obj, value):
-        """Store a new member `value` (in `obj.__dict__`).
+        """Store a new member `value`
+           (in `obj.__dict__` or in a slot of `obj`).
 
         - If not strict, converts value to member data type
           (instantiates type with value).
         - Calls `changed` hook functions.
+        - Skips unchanged values if `changed_only_if_different` is set.
+        """
+        value = self.convert(value)
+        if self.changed_only_if_different:
+            try:
+                unchanged = self.load(obj) == value
+            except AttributeError: # No value stored yet
+                unchanged = False
+            if unchanged:
+                self.suppressed += 1
+                return
+        if self.tracked:
+            self.track(obj, value)
+        self.store(obj, value)
+        self.notify(obj, value)
+
+    def convert(self, value):
+        """Get a new member `value` converted to member data type
+           (if not strict) and checked against the member value choices.
         """
         if value is not None and not isinstance(value, self.mtype):
             if self.strict:
@@ -213,15 +247,84 @@ class member(with_metaclass(Type, typed.base)):
         if self.choices and value not in self.choices:
             raise type(self).error(
               "Not a valid choice for '%s': %s" % (self.name, repr(value)))
+        return value
+
+    def checkchoices(self, values):
+        """Check all given `values` against the member value choices at once.
+
+        - Raises the member error for any invalid values.
+        """
+        if not self.choices:
+            return
+        invalid = self.choices.invalid(values)
+        if invalid:
+            raise type(self).error("Not valid choices for '%s': %s" % (
+              self.name, ', '.join(map(repr, invalid))))
+
+    def load(self, obj):
+        """Get the stored member value of `obj`
+           (from `obj.__dict__` or from a slot of `obj`).
+
+        - Raises AttributeError if no value is stored.
+        """
+        slot = self.slot
+        if slot is not None: # ==> Value stored in obj's __slots__
+            return slot.__get__(obj)
         # Get the instancemember for the given object...
         im = obj.__dict__[self.name]
-        im._ = value #... which also acts as value storage
-        # Finally call hook functions... first own (modeled class level)...
+        #... which acts as value storage:
+        return im._
+
+    def store(self, obj, value):
+        """Store an already converted member `value`
+           (in `obj.__dict__` or in a slot of `obj`)
+           without calling any hook functions.
+        """
+        slot = self.slot
+        if slot is not None: # ==> Store value in obj's __slots__
+            slot.__set__(obj, value)
+        else:
+            # Get the instancemember for the given object...
+            im = obj.__dict__[self.name]
+            im._ = value #... which also acts as value storage
+
+    def track(self, obj, value):
+        """Mark the member as changed in the model instance of `obj`
+           and journal the old and the new member `value`
+           if dirty tracking is enabled for the modeled class of `obj`.
+        """
+        model = obj.__dict__.get('model')
+        if model is None or model.dirty is None:
+            return
+        model.dirty.add(self.name)
+        if model.journal is not None:
+            # (via __get__, which also calls the getter of properties)
+            try:
+                old = self.__get__(obj, type(obj))
+            except AttributeError: # No value and no default or getter
+                old = None
+            model.journal.append((self.name, old, value))
+
+    def notify(self, obj, value):
+        """Call the `changed` hook functions
+           for a new member `value` of `obj`.
+
+        - Only collects the notification
+          if `obj` is in a :class:`modeled.batch` context.
+        """
+        model = obj.__dict__.get('model')
+        if model is not None and model.batched is not None:
+            model.batched.collect(self, obj, value)
+            return
+        # First own (modeled class level)...
         for func in self.changed:
             func(obj, value)
-        #... then instancemember level:
-        for func in im.changed:
-            func(value)
+        #... then instancemember level
+        # (maybe not created yet if member values are stored in __slots__):
+        im = obj.__dict__.get(self.name)
+        if im is not None:
+            for func in im.changed:
+                func(value)
 
     def __repr__(self):
         repr_ = 'modeled.' + type(self).__name__
@@ -242,6 +345,16 @@ class member(with_metaclass(Type, typed.base)):
 
 
 class InstanceMembersDictBase(simpledict.base):
+    @classmethod
+    def unchecked(cls, mapping):
+        """Create an instance directly using the given `mapping`
+           of already checked member names (like those of a modeled class)
+           as internal storage, skipping the key<-->attrname checks.
+        """
+        self = object.__new__(cls)
+        self.__dict__ = mapping
+        return self
+
     def __call__(self, mapping=None, **membervalues):
         return context(self, mapping, **membervalues)
 
@@ -0,0 +1,149 @@
+# python-modeled
+#
+# Copyright (C) 2014 Stefan Zimmermann <zimmermann.code@gmail.com>
+#
+# python-modeled is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# python-modeled is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with python-modeled.  If not, see <http://www.gnu.org/licenses/>.
+
+"""modeled.member.accessors
+
+Code generation of specialized member value accessors,
+which only contain the checks applying to the specific member.
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from six import exec_, get_unbound_function
+
+from moretools import qualname
+
+__all__ = ['specialize']
+
+# Imported at bottom:
+# - from modeled.member import member
+
+
+def getsource(m):
+    """Generate the source of a specialized __get__ method for member `m`.
+    """
+    lines = [
+      "def __get__(self, obj, owner=None):",
+      "    if obj is None:",
+      "        return self",
+      "    try:",
+      ]
+    if m.slot is not None:
+        lines.append("        return slot_get(obj, owner)")
+    else:
+        lines.append("        return obj.__dict__[name]._")
+    lines.append("    except AttributeError:")
+    if hasattr(m, 'default'):
+        lines.append("        return default")
+    else: # Let the general accessor raise the error
+        lines.append("        return member.__get__(self, obj, owner)")
+    return '\n'.join(lines)
+
+
+def setsource(m):
+    """Generate the source of a specialized __set__ method for member `m`.
+
+    - Falls back to the general :meth:`modeled.member.__set__`
+      if class level `changed` hooks were added,
+      for dirty tracking and for raising any errors.
+    """
+    lines = [
+      "def __set__(self, obj, value):",
+      "    if self.changed or self.tracked:",
+      "        return member.__set__(self, obj, value)",
+      "    if value is not None and type(value) is not mtype \\",
+      "      and not isinstance(value, mtype):",
+      ]
+    if m.strict:
+        lines.append("        return member.__set__(self, obj, value)")
+    else:
+        lines.append("        value = new(value)")
+    if m.choices:
+        lines.extend([
+          "    if value not in choices:",
+          "        return member.__set__(self, obj, value)",
+          ])
+    if m.slot is not None:
+        load = "slot_get(obj)"
+    else:
+        lines.append("    im = obj.__dict__[name]")
+        load = "im._"
+    if m.changed_only_if_different:
+        lines.extend([
+          "    try:",
+          "        if %s == value:" % load,
+          "            self.suppressed += 1",
+          "            return",
+          "    except AttributeError:",
+          "        pass",
+          ])
+    if m.slot is not None:
+        lines.extend([
+          "    slot_set(obj, value)",
+          "    im = obj.__dict__.get(name)",
+          "    if im is not None and im.changed:",
+          "        self.notify(obj, value)",
+          ])
+    else:
+        lines.extend([
+          "    im._ = value",
+          "    if im.changed:",
+          "        self.notify(obj, value)",
+          ])
+    return '\n'.join(lines)
+
+
+def specialize(m):
+    """Derive a class from the class of member `m`
+       with generated __get__ and __set__ methods specialized for `m`
+       and assign it to `m`.
+
+    - Only for members using the general :class:`modeled.member` accessors.
+    """
+    mcls = type(m)
+    for accessor in ['__get__', '__set__']:
+        if get_unbound_function(getattr(mcls, accessor)) \
+          is not get_unbound_function(getattr(member, accessor)):
+            return m
+
+    namespace = {
+      'member': member,
+      'name': m.name,
+      'mtype': m.mtype,
+      'new': m.new,
+      'choices': m.choices,
+      }
+    if m.slot is not None:
+        namespace.update(slot_get=m.slot.__get__, slot_set=m.slot.__set__)
+    try:
+        namespace['default'] = m.default
+    except AttributeError:
+        pass
+    exec_(getsource(m), namespace)
+    exec_(setsource(m), namespace)
+
+    class specialized(mcls):
+        __get__ = namespace['__get__']
+        __set__ = namespace['__set__']
+
+    specialized.__module__ = mcls.__module__
+    specialized.__name__ = mcls.__name__
+    specialized.__qualname__ = qualname(mcls)
+    m.__class__ = specialized
+    return m
+
+
+from . import member
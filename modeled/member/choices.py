@@ -0,0 +1,101 @@
+# python-modeled
+#
+# Copyright (C) 2014 Stefan Zimmermann <zimmermann.code@gmail.com>
+#
+# python-modeled is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# python-modeled is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with python-modeled.  If not, see <http://www.gnu.org/licenses/>.
+
+"""modeled.member.choices
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+__all__ = ['Choices']
+
+from six.moves import builtins
+
+
+class Choices(builtins.list):
+    """Ordered list of member value choices
+       with hash based membership tests for hashable choices.
+    """
+    def __init__(self, iterable=()):
+        builtins.list.__init__(self, iterable)
+        self.reindex()
+
+    def reindex(self):
+        """Rebuild the hash index (set to None if choices are unhashable).
+        """
+        try:
+            self.hashed = frozenset(self)
+        except TypeError:
+            self.hashed = None
+
+    def __contains__(self, value):
+        hashed = self.hashed
+        if hashed is not None:
+            try:
+                return value in hashed
+            except TypeError: # unhashable value
+                pass
+        return builtins.list.__contains__(self, value)
+
+    def invalid(self, values):
+        """Get a list of all distinct `values` which are no valid choices,
+           in order of their first occurrence.
+        """
+        if not hasattr(values, '__len__'): # iterator ==> iterated twice
+            values = builtins.list(values)
+        hashed = self.hashed
+        if hashed is not None:
+            try:
+                distinct = set(values)
+            except TypeError: # unhashable values
+                pass
+            else:
+                invalid = distinct - hashed
+                if not invalid:
+                    return []
+                # restore order
+                result = []
+                for value in values:
+                    if value in invalid:
+                        invalid.discard(value)
+                        result.append(value)
+                return result
+        result = []
+        for value in values:
+            if value not in self and value not in result:
+                result.append(value)
+        return result
+
+
+# Keep the hash index up to date on list modifications:
+def _reindexing(name):
+    method = getattr(builtins.list, name)
+
+    def modifier(self, *args):
+        result = method(self, *args)
+        self.reindex()
+        return result
+
+    modifier.__name__ = name
+    return modifier
+
+for _name in [
+  'append', 'extend', 'insert', 'remove', 'pop', 'clear',
+  '__setitem__', '__delitem__', '__iadd__', '__imul__',
+  '__setslice__', '__delslice__', # Python 2
+  ]:
+    if hasattr(builtins.list, _name):
+        setattr(Choices, _name, _reindexing(_name))
+del _name
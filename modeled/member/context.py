@@ -18,10 +18,14 @@
 """modeled.member.context
 
 Provides a context manager for modeled.object
-to work with temporarily changed member values in a with block.
+to work with temporarily changed member values in a with block
+and a context manager for batching member change notifications.
 
 .. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
 """
+from collections import OrderedDict
+
+__all__ = ['context', 'batch']
 
 
 class context(dict):
@@ -41,3 +45,42 @@ class context(dict):
     def __exit__(self, *exc):
         for membername, value in self.mbackup.items():
             self.members[membername].value = value
+
+
+class batch(object):
+    """Context manager for batching the `changed` hook calls
+       of member value changes of the given modeled instances.
+
+    - Collects the notifications in the with block,
+      only keeping the last value of each member of each instance,
+      and calls the hook functions on exit.
+    - Drops all notifications if the with block raises an exception.
+    """
+    def __init__(self, *minstances):
+        self.minstances = minstances
+        self.notifications = OrderedDict()
+
+    def collect(self, m, minstance, value):
+        """Collect the notification for a new `value`
+           of member `m` of `minstance`.
+        """
+        self.notifications[id(minstance), m] = (m, minstance, value)
+
+    def __enter__(self):
+        self.outer = []
+        for minstance in self.minstances:
+            model = minstance.model
+            self.outer.append(model.batched)
+            model.batched = self
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        # restore in reverse order to also handle repeated instances
+        for minstance, outer in reversed(list(
+              zip(self.minstances, self.outer))):
+            minstance.model.batched = outer
+        notifications = self.notifications.values()
+        self.notifications = OrderedDict()
+        if exc_type is None:
+            for m, minstance, value in notifications:
+                m.notify(minstance, value)
@@ -29,6 +29,8 @@ from moretools import cached, qualname, dictitems
 from .base import metabase as base
 from .model import Model
 from .member import ismodeledmemberclass, ismodeledmember
+from .member.accessors import specialize
+from .property import property as mproperty, ismodeledproperty
 from .extension import ExtensionDeco
 
 __all__ = [
@@ -58,6 +60,10 @@ class meta(base):
         if not any(issubclass(mb, mcs) for mb in metabases):
             # no? ==> change that
             metabases = (mcs, ) + metabases
+        # store member values in __slots__? (user-defined `slots` option)
+        if _slots(bases, clsattrs):
+            clsattrs['__slots__'] = tuple(clsattrs.get('__slots__', ())) \
+              + tuple(_slotnames(clsattrs))
         # is there a user-defined inner `meta` options class?
         meta = clsattrs.pop('meta', None)
         if meta:
@@ -81,27 +87,73 @@ class meta(base):
         """Finish a :class:`modeled.object`-derived `cls`.
 
         - Assigns the implicit names to :class:`modeled.member` instances.
+        - Connects members to their value slots (if `slots` option is set).
         - Creates the actual ``cls.model`` info class.
+        - Applies the `changed_only_if_different` model option to members.
+        - Specializes the value accessors of the members.
+        - Enables dirty tracking of members (if `dirty` option is set).
         """
+        slots = clsattrs.get('__slots__', ())
+        defined = []
+
         def members():
             for name, obj in clsattrs.items():
                 if ismodeledmemberclass(obj):
                     obj = obj()
                     obj.name = name
-                    setattr(cls, name, obj)
-                    yield obj
                 elif ismodeledmember(obj):
                     if not obj.name:
                         obj.name = name
-                    # also explicitly assign
-                    #  (was maybe only added to clsattrs dict
-                    #   by some derived metaclass)
-                    setattr(cls, name, obj)
-                    yield obj
+                else:
+                    continue
+                # also explicitly assign
+                #  (was maybe only added to clsattrs dict
+                #   by some derived metaclass)
+                setattr(cls, name, obj)
+                slotname = SLOTNAME % obj.name
+                if slotname in slots:
+                    obj.slot = cls.__dict__[slotname]
+                defined.append(obj)
+                yield obj
 
         options = clsattrs.get('model') # The user-defined model options
         model = cls.meta.model # The modeled class' model metaclass
         cls.model = model(mclass=cls, members=members(), options=options)
+        # finally generate the specialized member value accessors
+        changed_only_if_different = bool(getattr(
+          cls.model.options, 'changed_only_if_different', False))
+        for obj in defined:
+            if obj.changed_only_if_different is None:
+                obj.changed_only_if_different = changed_only_if_different
+            specialize(obj)
+        # also enable dirty tracking for inherited members if needed
+        if cls.model.tracking:
+            for name, obj in cls.model.members:
+                obj.tracked = True
+
+    def __setattr__(cls, name, value):
+        """Set a class attribute.
+
+        - Drops the cached instantiation plans of the modeled class
+          and its derived classes, because abstract methods might change
+          (like by ``@<modeled class>.method`` etc.).
+        """
+        base.__setattr__(cls, name, value)
+        cls._replan()
+
+    def __delattr__(cls, name):
+        """Delete a class attribute.
+
+        - Drops the cached instantiation plans, like :meth:`__setattr__`.
+        """
+        base.__delattr__(cls, name)
+        cls._replan()
+
+    def _replan(cls):
+        # cls.model is not finished during class creation in __init__
+        model = cls.__dict__.get('model')
+        if isinstance(model, Model):
+            model.replan()
 
     @cached
     def __getitem__(cls, bases):
@@ -119,6 +171,10 @@ class meta(base):
             class Derived(modeled.object[ModeledBaseOne, ModeledBaseTwo]):
                 # works!
                 ...
+
+        - Modeled classes with `slots` option,
+          which store their own member values in separate __slots__,
+          can't be combined (like any classes with separate __slots__).
         """
         mcs = type(cls)
         if not isinstance(bases, tuple):
@@ -131,6 +187,13 @@ class meta(base):
             metabases = (mcs, ) + metabases
         if not any(issubclass(b, cls) for b in bases):
             bases = (cls, ) + bases
+        solidbases = [sb for sb in map(_solidbase, bases) if sb is not None]
+        for sb in solidbases:
+            if not all(issubclass(sb, other) for other in solidbases):
+                raise TypeError(
+                  "Can't combine modeled classes %s with member values "
+                  "stored in separate __slots__ (`slots` option)"
+                  % basenames)
         clsattrs = {'__module__': cls.__module__}
         meta = type(clsname + '.meta', metabases, clsattrs)
         cls = meta(clsname, bases, clsattrs)
@@ -207,6 +270,44 @@ class meta(base):
         return func
 
 
+# Name pattern of the __slots__ storing member values
+# of modeled classes with `slots` option:
+SLOTNAME = '_m_%s'
+
+
+def _slotnames(clsattrs):
+    """Get the __slots__ names for all value storing members
+       defined in the given `clsattrs` of a modeled class.
+    """
+    for name, obj in clsattrs.items():
+        if ismodeledmemberclass(obj):
+            if not issubclass(obj, mproperty):
+                yield SLOTNAME % name
+        elif ismodeledmember(obj) and not ismodeledproperty(obj):
+            yield SLOTNAME % (obj.name or name)
+
+
+def _solidbase(cls):
+    """Get the first class in the MRO of `cls`,
+       which defines non-empty __slots__ (or None).
+    """
+    for supercls in cls.__mro__:
+        if supercls.__dict__.get('__slots__'):
+            return supercls
+    return None
+
+
+def _slots(bases, clsattrs):
+    """Check if the `slots` model option is set
+       in given `clsattrs` or inherited from modeled `bases`.
+    """
+    options = Model.options(clsattrs.get('model'))
+    if options and 'slots' in options:
+        return bool(options['slots'])
+    return any(getattr(b.model.options, 'slots', False)
+               for b in bases if isinstance(b, meta))
+
+
 class metamethod(object):
     """Decorator for methods of modeled classes.
     """
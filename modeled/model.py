@@ -19,25 +19,76 @@
 
 .. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
 """
-__all__ = ['Model']
+__all__ = ['Model', 'Plan']
 
+from six import get_unbound_function
+from six.moves import builtins
 from inspect import getmembers
+from collections import OrderedDict, deque
 
-from moretools import DictStruct
+from moretools import DictStruct, isdict
+
+import modeled
 
 
 class modelbase(object):
+    # The active modeled.batch context of the model instance
+    batched = None
+
+    # The set of changed member names
+    # and the journal of (member name, old value, new value) changes
+    # (if enabled with `dirty` or `journal` model options)
+    dirty = None
+    journal = None
+
     def __init__(self, minstance):
         self.minstance = minstance
-        self.members = InstanceMembersDict(
-          (name, instancemember(m, minstance)) for name, m in self.members)
-        minstance.__dict__.update(self.members)
+        members = OrderedDict(
+          (name, instancemember(m, minstance))
+          for name, m in type(self).plan.members.items())
+        minstance.__dict__.update(members)
+        # member names were already checked on modeled class creation
+        self.members = InstanceMembersDict.unchecked(members)
+        if self.tracking:
+            self.dirty = set()
+            if self.journaling:
+                self.journal = deque(maxlen=self.journaling)
+
+    def clear_dirty(self):
+        """Reset the set of changed member names and the change journal.
+        """
+        if self.dirty is not None:
+            self.dirty.clear()
+        if self.journal is not None:
+            self.journal.clear()
+
+    def batch(self):
+        """Get a :class:`modeled.batch` context
+           for batching member change notifications of the instance.
+        """
+        return batch(self.minstance)
+
+
+class Plan(object):
+    """Instantiation plan of a modeled class.
+
+    - Collects everything :class:`modeled.object` instantiation needs,
+      which is determined only once via reflection
+      and then cached in ``<modeled class>.model.plan``.
+    """
+    def __init__(self, model):
+        """Create the instantiation plan of `model.mclass`.
+        """
+        self.abstractmethods = model.mclass.__abstractmethods__
+        self.members = OrderedDict(model.members)
+        self.extensions = builtins.list(model.extensions.items())
 
 
 # Import modules that need to import modelbase in reverse:
 from .options import Options
 from .member import (
-  MembersDict, InstanceMembersDict, instancemember, getmodeledmembers)
+  MembersDict, InstanceMembersDict, instancemember, batch,
+  getmodeledmembers)
 from .property import PropertiesDict, ismodeledproperty
 
 
@@ -113,8 +164,183 @@ class Model(type):
             ## self.members = memberstype(mclass, getmodeledmembers(mclass))
         self.properties = PropertiesDict.struct(model=self, properties=(
           (name, m) for name, m in self.members if ismodeledproperty(m)))
+        # Track changed members of model instances (`dirty` option)
+        # and journal the changes (`journal` option with max length)?
+        self.journaling = int(getattr(self.options, 'journal', 0) or 0)
+        self.tracking = bool(
+          getattr(self.options, 'dirty', False) or self.journaling)
+        # If all member values are stored in mclass.__slots__
+        # (`slots` option), model instances are only created on demand
+        # (if not needed for dirty tracking):
+        self.compact = bool(getattr(self.options, 'slots', False)) \
+          and not self.tracking and all(
+            m.slot is not None
+            for name, m in self.members(properties=False))
         # self.extensions = []
 
+    def __get__(self, minstance, mclass=None):
+        """Get the model info class on modeled class level
+           or the model instance of a modeled `minstance`.
+
+        - Only called for compact modeled instances
+          without model instance yet, which then gets created.
+        """
+        if minstance is None:
+            return self
+        model = minstance.__dict__['model'] = self(minstance=minstance)
+        return model
+
+    @property
+    def plan(cls):
+        """Get the cached :class:`modeled.model.Plan`
+           for instantiating the modeled class.
+        """
+        try:
+            return cls.__dict__['_plan']
+        except KeyError:
+            plan = cls._plan = Plan(cls)
+            return plan
+
+    def build_many(cls, rows, columns=None, lazy=False, defer=False):
+        """Create many instances of the modeled class at once.
+
+        - Takes an iterable of `rows`, which are either dicts
+          of member values or sequences of member values
+          for the member names given in `columns`,
+          which default to all non-property member names.
+        - Members, their value converters and value storage
+          and the creation of model instances are only resolved once.
+        - Returns a list of the modeled instances
+          or a generator if `lazy` is set.
+        - If `defer` is set, class level `changed` hooks of members
+          are not called for each single member value,
+          but after all rows were processed
+          (or when a `lazy` generator is closed before).
+        """
+        mclass = cls.mclass
+        plan = cls.plan
+        if columns is None:
+            columns = [name for name, _ in cls.members(properties=False)]
+        # classes with extensions or custom initialization
+        # need the full modeled.object.__init__ for each instance
+        init = plan.extensions or get_unbound_function(mclass.__init__) \
+          is not get_unbound_function(modeled.object.__init__)
+        if plan.abstractmethods:
+            mclass.__new__(mclass) # raises the TypeError
+        # resolve instance creation only once...
+        new = super(modeled.object, mclass).__new__
+        if cls.compact or cls.tracking:
+            compact = cls.compact
+
+            def create():
+                obj = new(mclass)
+                if not compact:
+                    obj.model = cls(minstance=obj)
+                return obj
+        else:
+            # the same as modelbase.__init__,
+            # but without looking up the plan for every instance
+            modelnew = builtins.object.__new__
+            unchecked = InstanceMembersDict.unchecked
+            items = builtins.list(plan.members.items())
+
+            def create():
+                obj = new(mclass)
+                model = modelnew(cls)
+                model.minstance = obj
+                members = OrderedDict([
+                  (name, instancemember(m, obj)) for name, m in items])
+                obj.__dict__.update(members)
+                model.members = unchecked(members)
+                obj.model = model
+                return obj
+
+        deferred = []
+
+        def setter(m):
+            """Get the value setter function for member `m`,
+               which bypasses __set__ if no hooks are called immediately.
+            """
+            if modeled.ismodeledproperty(m) or m.changed and not defer:
+                return m.__set__
+
+            convert, load, store = m.convert, m.load, m.store
+            if m.slot is None and not (m.changed or m.tracked):
+                name = m.name
+
+                # no hooks, no tracking and no value stored yet
+                # (so also nothing to suppress),
+                # which allows storing in the instancemember directly
+                def set(obj, value):
+                    obj.__dict__[name]._ = convert(value)
+
+                return set
+
+            hooked = bool(m.changed)
+
+            def set(obj, value):
+                value = convert(value)
+                if m.changed_only_if_different:
+                    try:
+                        unchanged = load(obj) == value
+                    except AttributeError: # No value stored yet
+                        unchanged = False
+                    if unchanged:
+                        m.suppressed += 1
+                        return
+                if m.tracked:
+                    m.track(obj, value)
+                store(obj, value)
+                if hooked:
+                    deferred.append((m, obj, value))
+
+            return set
+
+        #... and all member value storage
+        setters = {name: setter(m) for name, m in plan.members.items()}
+        ordered = [setters[name] for name in columns]
+
+        def notify():
+            for m, obj, value in deferred:
+                m.notify(obj, value)
+            del deferred[:]
+
+        def build():
+            try:
+                for row in rows:
+                    if init:
+                        if not isdict(row):
+                            row = zip(columns, row)
+                        yield mclass(**dict(row))
+                        continue
+                    obj = create()
+                    if isdict(row):
+                        for name, value in row.items():
+                            setters[name](obj, value)
+                    else:
+                        for set, value in zip(ordered, row):
+                            set(obj, value)
+                    yield obj
+            except GeneratorExit: # lazy generator closed before exhausted
+                notify()
+                raise
+            notify()
+
+        if lazy:
+            return build()
+        return builtins.list(build())
+
+    def replan(cls):
+        """Drop the cached instantiation plan of this model
+           and of all derived models.
+        """
+        try:
+            del cls._plan
+        except AttributeError: # No plan created yet
+            pass
+        for model in cls.__subclasses__():
+            model.replan()
+
     def __repr__(self):
         return '%s.model' % self.mclass.__name__
 
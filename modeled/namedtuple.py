@@ -19,12 +19,13 @@
 
 .. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
 """
-from six import with_metaclass
+from six import with_metaclass, exec_
 
 __all__ = ['namedtuple']
 
 import sys
 import collections
+from itertools import chain
 
 from moretools import cached
 
@@ -39,7 +40,86 @@ class Type(mtuple.type):
     def __getitem__(cls, mtypes, typedcls=None):
         mtypes = tuple(mtypes)
         assert(len(mtypes) == len(cls._fields))
-        return mtuple.type.__getitem__(cls, mtypes, typedcls)
+        typedcls = mtuple.type.__getitem__(cls, mtypes, typedcls)
+        # all helpers get private names, which can't clash with field names
+        namespace = dict(
+          ('_m%d_' % i, mtype) for i, mtype in enumerate(mtypes))
+        namespace.update(
+          _missing_=MISSING, _new_=tuple.__new__, _type_=type)
+        exec_(newsource(cls._fields), namespace)
+        exec_(makemanysource(cls._fields), namespace)
+        typedcls.__new__ = staticmethod(namespace['__new__'])
+        typedcls._make_many = classmethod(namespace['_make_many'])
+        return typedcls
+
+
+#: Default for unset field args in generated __new__ methods
+MISSING = object()
+
+
+def convertsource(fields, indent):
+    """Generate the lines converting the positional ``_<i>_`` locals
+       of the `fields`, if not exactly of the field's mtype.
+    """
+    lines = []
+    for i in range(len(fields)):
+        lines.extend([
+          "if _type_(_%d_) is not _m%d_:" % (i, i),
+          "    _%d_ = _m%d_(_%d_)" % (i, i, i),
+          ])
+    return [indent + line for line in lines]
+
+
+def localsource(fields):
+    """Generate the comma separated positional ``_<i>_`` locals
+       of the `fields`, which can't clash with any names
+       used by the generated code.
+    """
+    return ''.join('_%d_, ' % i for i in range(len(fields)))
+
+
+def newsource(fields):
+    """Generate __new__ for typed namedtuple classes,
+       which binds either an iterable or field keyword args directly.
+    """
+    names = ''.join('%s, ' % name for name in fields)
+    locals_ = localsource(fields)
+    unset = ' or '.join('%s is _missing_' % name for name in fields)
+    anyset = ' or '.join('%s is not _missing_' % name for name in fields)
+    return '\n'.join([
+      "def __new__(_cls_, _iterable_=_missing_%s):" % ''.join(
+        ', %s=_missing_' % name for name in fields),
+      "    if _iterable_ is _missing_:",
+      "        if %s:" % (unset or 'False'),
+      "            raise TypeError(",
+      "              '%s() needs an iterable or all field args'",
+      "              % _cls_.__name__)",
+      "        (%s) = (%s)" % (locals_, names),
+      "    elif %s:" % (anyset or 'False'),
+      "        raise TypeError(",
+      "          '%s() takes either an iterable or field args'",
+      "          % _cls_.__name__)",
+      "    else:",
+      "        (%s) = _iterable_" % locals_,
+      ] + convertsource(fields, '    ') + [
+      "    return _new_(_cls_, (%s))" % locals_,
+      ])
+
+
+def makemanysource(fields):
+    """Generate _make_many for typed namedtuple classes,
+       which converts and creates all rows in a single loop.
+    """
+    locals_ = localsource(fields)
+    return '\n'.join([
+      "def _make_many(_cls_, _rows_):",
+      "    _result_ = []",
+      "    _append_ = _result_.append",
+      "    for (%s) in _rows_:" % locals_,
+      ] + convertsource(fields, '        ') + [
+      "        _append_(_new_(_cls_, (%s)))" % locals_,
+      "    return _result_",
+      ])
 
 
 def namedtuple(typename, names):
@@ -47,25 +127,38 @@ def namedtuple(typename, names):
 
     class namedtuple(with_metaclass(Type, typed.base, basetuple)):
         def __new__(cls, iterable=(), **fields):
+            """Create an instance of a typed namedtuple class
+               derived from the types of the given items.
+
+            - Typed classes get a generated __new__.
+            """
             if fields:
-                items = tuple(item[1] for item in sorted(
-                  fields.items(),
-                  key=lambda item: cls._fields.index(item[0])))
+                try:
+                    items = tuple(fields.pop(name) for name in cls._fields)
+                except KeyError as exc:
+                    raise TypeError("%s() missing field arg %s" % (
+                      cls.__name__, exc))
+                if fields:
+                    raise TypeError("%s() got unknown field args %s" % (
+                      cls.__name__, ', '.join(map(repr, fields))))
             else:
                 items = tuple(iterable)
+            cls = cls[tuple(map(type, items))]
+            return tuple.__new__(cls, items)
+
+        @classmethod
+        def _make_many(cls, rows):
+            """Create a list of instances from an iterable of `rows`.
+
+            - Derives the typed class from the first row.
+            """
+            rows = iter(rows)
             try:
-                cls.mtypes
-            except AttributeError:
-                cls = cls[tuple(map(type, items))]
-                return tuple.__new__(cls, items)
-
-            assert(len(cls.mtypes) == len(items))
-            items = tuple( # <-- pre-evaluate generator
-              # to avoid misleading TypeError from __new__ below
-              # (compalaining about missing args,
-              #  although problem is mtype(item) conversion)
-              mtype(item) for mtype, item in zip(cls.mtypes, items))
-            return basetuple.__new__(cls, items)
+                first = tuple(next(rows))
+            except StopIteration:
+                return []
+            return cls[tuple(map(type, first))]._make_many(
+              chain([first], rows))
 
     try: # Taken from collections.py:
         namedtuple.__module__ = sys._getframe(1).f_globals.get(
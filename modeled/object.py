@@ -37,30 +37,36 @@ class object(with_metaclass(meta, base)):
     __module__ = 'modeled'
 
     def __new__(cls, *args, **kwargs):
-        abcnames = cls.__abstractmethods__
+        model = cls.model
+        abcnames = model.plan.abstractmethods
         if abcnames:
             raise TypeError(
                 "Can't instantiate abstract %s with abstract methods %s"
                 % (repr(cls), ", ".join(map(repr, abcnames))))
         self = base.__new__(cls)
-        self.model = cls.model(minstance=self)
+        # compact instances (`slots` option) create their model on demand
+        if not model.compact:
+            self.model = model(minstance=self)
         return self
 
     def __init__(self, **membervalues):
+        model = type(self).model
+        plan = model.plan
+        members = plan.members
         for name, value in membervalues.items():
-            self.m[name].value = value
+            members[name].__set__(self, value)
 
         extclasses = []
-        for extclass, extdeco in self.model.extensions.items():
+        for extclass, extdeco in plan.extensions:
             if extdeco.check(self):
                 extclasses.append(extclass)
-                for name, m in extclass.model.members:
+                for name, m in extclass.model.plan.members.items():
                     self.m[name] = self.__dict__[name] \
                       = instancemember(m, self)
         if extclasses:
             meta = type('meta', tuple(ext.meta for ext in extclasses), {})
             self.__class__ = type(self).type(
-                self.model.name, tuple(extclasses) + (type(self), ), {
+                model.name, tuple(extclasses) + (type(self), ), {
                     '__module__': type(self).__module__,
                     'meta': meta,
                 })
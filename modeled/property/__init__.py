@@ -133,15 +133,11 @@ class property(with_metaclass(Type, member)):
         if self.choices and value not in self.choices:
             raise type(self).error(
               "Not a valid choice for '%s': %s" % (self.name, repr(value)))
+        if self.tracked:
+            self.track(obj, value)
         self.fset(obj, value)
-        # Get the instancemember for the given object...
-        im = obj.__dict__[self.name]
-        # Finally call hook functions... first own (modeled class level)...
-        for func in self.changed:
-            func(obj, value)
-        #... then instancemember level:
-        for func in im.changed:
-            func(value)
+        # Finally call hook functions
+        self.notify(obj, value)
 
 
 def ismodeledproperty(obj):
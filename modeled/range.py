@@ -19,11 +19,16 @@
 
 .. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
 """
-from six import with_metaclass
+from six import with_metaclass, integer_types
 
 __all__ = ['range']
 
-from operator import lt, le
+from operator import add, lt, le, gt, ge
+from datetime import date, datetime, timedelta
+from itertools import product
+from multiprocessing import cpu_count
+
+from six.moves import xrange
 
 from moretools import cached
 
@@ -36,6 +41,14 @@ class Type(typed.base.type):
       str: lambda value, step: chr(ord(value) + step),
       }
 
+    #: Types whose range values can be computed as start + index * step
+    ARITHMETIC_TYPES = integer_types + (float, date)
+
+    #: Step types which also allow computing range lengths and indexes
+    #  (other steps, like calendar :class:`modeled.datetime.months`,
+    #  use a precomputed :attr:`range.schedule`)
+    ARITHMETIC_STEPS = integer_types + (float, timedelta)
+
     @cached
     def __getitem__(cls, mtype):
         class typedcls(cls):
@@ -44,13 +57,17 @@ class Type(typed.base.type):
         if type(mtype) is tuple:
             mtype = mtuple[mtype]
             incfuncs = tuple(
-                cls.INC_FUNCTIONS.get(mt, mt.__add__)
+                cls.INC_FUNCTIONS.get(mt, add)
                 for mt in mtype.mtypes)
             typedcls.inc = staticmethod(lambda value, step: tuple(
               f(v, s) for f, v, s in zip(incfuncs, value, step)))
+            mtypes = mtype.mtypes
         else:
             typedcls.inc = staticmethod(
-                cls.INC_FUNCTIONS.get(mtype, mtype.__add__))
+                cls.INC_FUNCTIONS.get(mtype, add))
+            mtypes = (mtype, )
+        typedcls.arithmetic = all(
+          issubclass(mt, cls.ARITHMETIC_TYPES) for mt in mtypes)
         return typed.base.type.__getitem__(cls, mtype, typedcls=typedcls)
 
     def inclusive(cls, start, stop, step=1):
@@ -58,6 +75,20 @@ class Type(typed.base.type):
 
     inc = inclusive
 
+    def grid(cls, start, stop, step=1, inclusive=False):
+        """Create the cartesian product of per component ranges
+           from tuple `start` to tuple `stop` by (tuple) `step`.
+        """
+        try:
+            mtype = cls.mtype
+        except AttributeError:
+            mtype = mtuple[tuple(map(type, start))]
+        if not isinstance(step, tuple):
+            step = (step, ) * len(start)
+        return grid(mtype, (
+          range[mt](s, e, st, inclusive)
+          for mt, s, e, st in zip(mtype.mtypes, start, stop, step)))
+
 
 class range(with_metaclass(Type, typed.base)):
     __module__ = 'modeled'
@@ -73,12 +104,90 @@ class range(with_metaclass(Type, typed.base)):
         else:
             if not isinstance(start, mtype):
                 start = mtype(start)
+        if isinstance(start, tuple) and not isinstance(step, tuple):
+            step = (step, ) * len(start)
         self.start = start
         self.stop = stop
         self.step = step
         self.inclusive = inclusive
 
+    @property
+    def lead(self):
+        """The (first component of the) step,
+           which determines the range direction.
+        """
+        step = self.step
+        return step[0] if isinstance(step, tuple) else step
+
+    @property
+    def computable(self):
+        """Can values, length and membership be computed arithmetically?
+        """
+        lead = self.lead
+        return self.arithmetic and bool(lead) \
+          and isinstance(lead, Type.ARITHMETIC_STEPS)
+
+    @property
+    def schedule(self):
+        """The precomputed list of all range values,
+           used by ranges whose values can't be computed arithmetically.
+
+        - Only recomputed after changing start, stop, step or inclusive.
+        """
+        key = (self.start, self.stop, self.step, self.inclusive)
+        try:
+            cachedkey, values = self.__dict__['_schedule']
+        except KeyError:
+            cachedkey = None
+        if cachedkey != key:
+            # extra iter() because list() tries .__len__()
+            #  ==> endless recursion
+            values = list(iter(self))
+            self._schedule = key, values
+        return values
+
+    def check(self, value):
+        """Check if `value` hasn't passed the stop value yet.
+        """
+        lead = self.lead
+        if lead < lead * 0:
+            check = self.inclusive and ge or gt
+        else:
+            check = self.inclusive and le or lt
+        return check(value, self.stop)
+
+    def at(self, index):
+        """Compute the value at non-negative `index`
+           without checking the range bounds.
+        """
+        start, step = self.start, self.step
+        if isinstance(step, tuple):
+            value = tuple(s + index * st for s, st in zip(start, step))
+        else:
+            value = start + index * step
+        mtype = self.mtype
+        if not isinstance(value, mtype):
+            value = mtype(value)
+        return value
+
     def __iter__(self):
+        if self.computable:
+            at = self.at
+            for index in xrange(len(self)):
+                yield at(index)
+            return
+
+        if self.arithmetic and self.lead:
+            # calendar steps ==> compute each value from start
+            #  to avoid accumulating day clipping at month ends
+            at, check = self.at, self.check
+            index, value = 0, self.start
+            while check(value):
+                yield value
+                index += 1
+                value = at(index)
+            return
+
         mtype = self.mtype
         value, stop, step = self.start, self.stop, self.step
         check = self.inclusive and le or lt
@@ -88,18 +197,156 @@ class range(with_metaclass(Type, typed.base)):
             yield value
             value = self.inc(value, step)
 
+    def __reversed__(self):
+        if not self.computable:
+            for value in reversed(self.schedule):
+                yield value
+            return
+
+        at = self.at
+        for index in xrange(len(self) - 1, -1, -1):
+            yield at(index)
+
     def __len__(self):
-        # extra iter() because list() tries .__len__() ==> endless recursion
-        return len(list(iter(self)))
+        if not self.computable:
+            return len(self.schedule)
+
+        start, stop, step = self.start, self.stop, self.step
+        if isinstance(step, tuple):
+            start, stop, step = start[0], stop[0], step[0]
+        # estimate from the (leading) values, then correct the estimate
+        #  for inclusive stops, float rounding and tuple comparison
+        count = max(0, int(-((start - stop) // step)))
+        at, check = self.at, self.check
+        while count and not check(at(count - 1)):
+            count -= 1
+        while check(at(count)):
+            count += 1
+        return count
+
+    def index(self, value):
+        if not self.computable:
+            return self.schedule.index(value)
+
+        start, step = self.start, self.step
+        lead = value
+        if isinstance(step, tuple):
+            start, step, lead = start[0], step[0], value[0]
+        if any(isinstance(v, float) for v in (start, step, lead)):
+            index = int(round((lead - start) / float(step)))
+        else:  # exact int or timedelta division
+            index, rest = divmod(lead - start, step)
+            if rest:
+                raise ValueError("%s is not in range" % repr(value))
+        if 0 <= index < len(self) and self.at(index) == value:
+            return index
+        raise ValueError("%s is not in range" % repr(value))
 
     def __contains__(self, value):
-        return value in iter(self)
+        if not self.computable:
+            return value in self.schedule
+
+        try:
+            self.index(value)
+        except (ValueError, TypeError, IndexError):
+            return False
+        return True
+
+    def __getitem__(self, index):
+        if not self.computable:
+            return self.schedule[index]
+
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            count = len(xrange(start, stop, step))
+            if isinstance(self.step, tuple):
+                step = tuple(st * step for st in self.step)
+            else:
+                step = self.step * step
+            sliced = type(self)(self.at(start), None, step)
+            # stop exactly at the first excluded value,
+            #  computed like the sliced range will compute its values
+            sliced.stop = sliced.at(count)
+            return sliced
+
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("%s index out of range" % type(self).__name__)
+        return self.at(index)
+
+    def split(self, count):
+        """Split into a list of `count` consecutive sub-ranges
+           of (almost) equal length.
+
+        - Tuple ranges are split along their sequence of tuple values.
+        """
+        length = len(self)
+        return [self[length * i // count:length * (i + 1) // count]
+                for i in xrange(count)]
+
+    def chunks(self, size):
+        """Iterate consecutive sub-ranges of (at most) `size` values.
+        """
+        for start in xrange(0, len(self), size):
+            yield self[start:start + size]
+
+    def map(self, func, executor=None, chunksize=None):
+        """Iterate the results of `func` for all range values in order.
+
+        - Optionally distributes chunks of the range
+          to a :mod:`concurrent.futures` `executor`.
+        - `chunksize` defaults to splitting the range
+          into 4 chunks per CPU.
+        """
+        if executor is None:
+            for value in self:
+                yield func(value)
+            return
+
+        if chunksize:
+            chunks = self.chunks(chunksize)
+        else:
+            chunks = self.split(4 * (cpu_count() or 1))
+        futures = [executor.submit(_mapchunk, func, chunk)
+                   for chunk in chunks]
+        for future in futures:
+            for result in future.result():
+                yield result
+
+    def arrays(self, size, dtype=None):
+        """Lazily iterate NumPy arrays of (at most) `size` range values.
+        """
+        for chunk in self.chunks(size):
+            yield chunk.__array__(dtype)
+
+    def __reduce__(self):
+        # typed range classes are created dynamically
+        #  and can't be pickled by reference ==> derive type from start
+        #  (also from stop and step, which can be modeled tuples as well)
+        args = tuple(tuple(value) if isinstance(value, tuple) else value
+                     for value in (self.start, self.stop, self.step))
+        return (range, args + (self.inclusive, ))
 
     def __array__(self, dtype=None):
         import numpy
-        # extra iter() because list() tries .__len__(),
-        #  which also creates list
-        return numpy.array(list(iter(self)), dtype=dtype)
+        if not self.computable:
+            if dtype is None and isinstance(self.start, date):
+                dtype = 'datetime64[%s]' % (
+                  'us' if isinstance(self.start, datetime) else 'D')
+            return numpy.array(self.schedule, dtype=dtype)
+
+        indexes = numpy.arange(len(self))
+        if isinstance(self.start, date):
+            start = numpy.datetime64(self.start)
+            step = numpy.timedelta64(self.step)
+        else:
+            start, step = numpy.asarray(self.start), numpy.asarray(self.step)
+            if step.ndim:  # tuple range ==> (N, k) array
+                indexes = indexes[:, numpy.newaxis]
+        values = start + indexes * step
+        return values if dtype is None else values.astype(dtype, copy=False)
 
     def __repr__(self):
         cls = type(self)
@@ -108,3 +355,79 @@ class range(with_metaclass(Type, typed.base)):
             text += '.inclusive'
         return text + '(%s, %s, %s)' % (
           repr(self.start), repr(self.stop), repr(self.step))
+
+
+class grid(object):
+    """The cartesian product of component ranges,
+       created by :meth:`range.grid`.
+    """
+    def __init__(self, mtype, ranges):
+        self.mtype = mtype
+        self.ranges = tuple(ranges)
+
+    @property
+    def shape(self):
+        return tuple(len(r) for r in self.ranges)
+
+    def __len__(self):
+        length = 1
+        for r in self.ranges:
+            length *= len(r)
+        return length
+
+    def __iter__(self):
+        mtype = self.mtype
+        for values in product(*self.ranges):
+            yield mtype(values)
+
+    def __getitem__(self, index):
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("range.grid index out of range")
+        values = []
+        for r in reversed(self.ranges):
+            index, rindex = divmod(index, len(r))
+            values.insert(0, r[rindex])
+        return self.mtype(values)
+
+    def __contains__(self, value):
+        return len(value) == len(self.ranges) and all(
+          v in r for v, r in zip(value, self.ranges))
+
+    def __array__(self, dtype=None):
+        """Get all grid points as (N, k) array.
+        """
+        import numpy
+        columns = [numpy.asarray(r) for r in self.ranges]
+        points = numpy.stack(
+          numpy.meshgrid(*columns, indexing='ij'), axis=-1).reshape(
+            -1, len(columns))
+        return points if dtype is None else points.astype(dtype, copy=False)
+
+    def arrays(self, size, dtype=None):
+        """Lazily iterate (at most `size`, k) arrays of grid points.
+        """
+        import numpy
+        columns = [numpy.asarray(r) for r in self.ranges]
+        shape, length = self.shape, len(self)
+        for start in xrange(0, length, size):
+            indexes = numpy.unravel_index(
+              numpy.arange(start, min(start + size, length)), shape)
+            points = numpy.column_stack(
+              [column[i] for column, i in zip(columns, indexes)])
+            yield points if dtype is None \
+              else points.astype(dtype, copy=False)
+
+    def __repr__(self):
+        return 'modeled.range.grid(%s, %s, %s)' % tuple(
+          repr(tuple(getattr(r, attr) for r in self.ranges))
+          for attr in ('start', 'stop', 'step'))
+
+
+def _mapchunk(func, chunk):
+    """Apply `func` to all values of a range `chunk`
+       in a :meth:`range.map` worker.
+    """
+    return [func(value) for value in chunk]
@@ -0,0 +1,254 @@
+# python-modeled
+#
+# Copyright (C) 2014 Stefan Zimmermann <zimmermann.code@gmail.com>
+#
+# python-modeled is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# python-modeled is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with python-modeled.  If not, see <http://www.gnu.org/licenses/>.
+
+"""modeled.table
+
+Column-wise (struct of arrays) storage
+of :class:`modeled.object` instances.
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from six import with_metaclass
+
+__all__ = ['table', 'ismodeledtableclass', 'ismodeledtable']
+
+from six.moves import builtins
+from array import array
+from collections import OrderedDict
+
+from moretools import cached, isdict
+
+from .list import TYPECODES as LIST_TYPECODES
+from .member import InstanceMembersDict, instancemember
+from .object import ismodeledclass, ismodeledobject
+from . import typed
+
+
+# The array.array typecodes for storing numeric member types:
+TYPECODES = builtins.dict(LIST_TYPECODES)
+TYPECODES[bool] = 'B'
+
+
+class column(object):
+    """Descriptor for accessing a table column value via a row view.
+
+    - Converts and checks new values and calls the `changed` hooks
+      of the original :class:`modeled.member`.
+    """
+    def __init__(self, m):
+        self.m = m
+        self.name = m.name
+        self.title = m.title
+        self.isbool = m.mtype is bool
+
+    def __get__(self, row, owner=None):
+        if row is None:
+            return self
+        value = row._table.columns[self.name][row._index]
+        if self.isbool:
+            return bool(value)
+        return value
+
+    def __set__(self, row, value):
+        value = self.m.convert(value)
+        row._table.columns[self.name][row._index] = value
+        self.m.notify(row, value)
+
+
+class Type(typed.base.type):
+    """Metaclass for :class:`modeled.table`.
+
+    - Provides modeled.table[<modeled class>] syntax,
+      which also derives the modeled row view class.
+    """
+    __module__ = 'modeled'
+
+    @cached
+    def __getitem__(cls, mclass):
+        if not ismodeledclass(mclass):
+            raise TypeError(
+              "modeled.table[] arg must be a subclass of modeled.object")
+
+        typedcls = typed.base.type.__getitem__(cls, mclass)
+
+        # the row view class
+        class row(mclass):
+            __slots__ = ['_table', '_index']
+
+            @property
+            def m(self):
+                """To access instancemember objects via ``row.m.<name>``,
+                   which get and set the values in the table columns.
+                """
+                return InstanceMembersDict(
+                  (name, instancemember(col, self))
+                  for name, col in type(self).columns)
+
+            def __repr__(self):
+                return '%s.row(%d)' % (repr(self._table), self._index)
+
+        def model(self):
+            raise AttributeError(
+              "%s has no model instance. Use .m to access members."
+              % repr(self))
+
+        # (set after class creation, which assigns the derived model)
+        row.model = property(model)
+        row.columns = []
+        for name, m in mclass.model.members(properties=False):
+            col = column(m)
+            setattr(row, name, col)
+            row.columns.append((name, col))
+        row.__module__ = mclass.__module__
+        row.__name__ = '%s.row' % typedcls.__name__
+        typedcls.row = row
+        return typedcls
+
+Type.__name__ = 'table.type'
+
+
+class table(with_metaclass(Type, typed.base)):
+    """Column-wise storage of instances
+       of a :class:`modeled.object`-derived class.
+
+    - Instantiated via modeled.table[<modeled class>]
+    - Columns are created for all non-property members,
+      using `array.array` for int, float and bool members
+      and `list` for all other member types.
+    - Array columns are limited to the value range of their typecode
+      (like 64 bit ints) and can't store None values.
+      Rows with such values are rejected as a whole.
+    - Rows are accessed via lightweight views,
+      which are instances of the modeled class.
+    """
+    __module__ = 'modeled'
+
+    def __init__(self, iterable=()):
+        try:
+            mclass = self.mtype
+        except AttributeError:
+            raise TypeError(
+              "modeled.table needs a modeled class: "
+              "modeled.table[<modeled class>]")
+        self.members = OrderedDict(mclass.model.members(properties=False))
+        self.columns = OrderedDict(
+          (name, self.newcolumn(m)) for name, m in self.members.items())
+        self.extend(iterable)
+
+    @staticmethod
+    def newcolumn(m):
+        """Create an empty column storage for values of member `m`.
+        """
+        try:
+            return array(TYPECODES[m.mtype])
+        except KeyError:
+            return builtins.list()
+
+    def col(self, name):
+        """Get the actual storage of the column with member `name`,
+           which is no copy, so changes are not checked.
+        """
+        return self.columns[name]
+
+    def append(self, item):
+        """Append a row from a modeled instance `item`,
+           a dict of member values or a sequence of member values
+           in member order.
+
+        - Member order is the order of ``<modeled class>.model.members``,
+          where members defined by class only (like ``m[int]``)
+          come after all instantiated members (like ``m[int](0)``).
+
+        - Missing member values are filled with member defaults.
+        """
+        if ismodeledobject(item):
+            values = (m.__get__(item, type(item))
+                      for m in self.members.values())
+        else:
+            if isdict(item):
+                mvalues = item
+            else:
+                mvalues = builtins.dict(zip(self.members, item))
+            values = []
+            for name, m in self.members.items():
+                try:
+                    value = mvalues[name]
+                except KeyError:
+                    try:
+                        value = m.default
+                    except AttributeError:
+                        raise type(m).error(
+                          "'%s' has no default value." % name)
+                values.append(m.convert(value))
+        # first collect all values for checking row completeness...
+        values = builtins.list(values)
+        #... then extend the columns,
+        # removing the row again if any array column rejects its value
+        appended = []
+        try:
+            for column, value in zip(self.columns.values(), values):
+                column.append(value)
+                appended.append(column)
+        except (TypeError, OverflowError):
+            for column in appended:
+                column.pop()
+            raise
+
+    def extend(self, iterable):
+        for item in iterable:
+            self.append(item)
+
+    def __len__(self):
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, index):
+        """Get a row view at `index`.
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("modeled.table index out of range")
+        row = builtins.object.__new__(type(self).row)
+        row._table = self
+        row._index = index
+        return row
+
+    def __iter__(self):
+        for index in builtins.range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return 'modeled.%s' % type(self).__name__
+
+
+def ismodeledtableclass(cls):
+    """Checks if `cls` is a subclass of :class:`modeled.table`.
+    """
+    try:
+        return issubclass(cls, table)
+    except TypeError: # No class at all
+        return False
+
+
+def ismodeledtable(obj):
+    """Checks if `obj` is an instance
+       of :class:`modeled.table` (or a derived class).
+    """
+    return isinstance(obj, table)
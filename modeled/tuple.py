@@ -19,7 +19,7 @@
 
 .. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
 """
-from six import with_metaclass
+from six import with_metaclass, exec_
 
 __all__ = ['tuple', 'ismodeledtupleclass', 'ismodeledtuple']
 
@@ -40,6 +40,7 @@ class Type(typed.base.type):
                 pass
 
         typedcls.mtypes = mtypes = builtins.tuple(mtypes)
+        typedcls._convert = staticmethod(converter(mtypes))
         typedcls.__module__ = cls.__module__
         typedcls.__name__ = '%s[%s]' % (
           cls.__name__, ', '.join(t.__name__ for t in typedcls.mtypes))
@@ -48,20 +49,54 @@ class Type(typed.base.type):
 Type.__name__ = 'tuple.type'
 
 
+def converter(mtypes):
+    """Compile a function for converting a tuple of items to `mtypes`,
+       which only converts items not exactly of their mtype.
+    """
+    names = ''.join('_%d, ' % i for i in range(len(mtypes)))
+    source = '\n'.join([
+      "def convert(items):",
+      "    (%s) = items" % names,
+      "    return (%s)" % ''.join(
+        '_%d if type(_%d) is _m%d else _m%d(_%d), ' % ((i, ) * 5)
+        for i in range(len(mtypes))),
+      ])
+    namespace = dict(('_m%d' % i, mtype) for i, mtype in enumerate(mtypes))
+    exec_(source, namespace)
+    return namespace['convert']
+
+
 class tuple(with_metaclass(Type, typed.base, builtins.tuple)):
     __module__ = 'modeled'
 
     def __new__(cls, iterable):
         items = builtins.tuple(iterable)
         try:
-            cls.mtypes
+            convert = cls._convert
         except AttributeError:
             cls = cls[builtins.tuple(map(type, items))]
             return builtins.tuple.__new__(cls, items)
 
-        assert(len(cls.mtypes) == len(items))
-        items = (mtype(item) for mtype, item in zip(cls.mtypes, items))
-        return builtins.tuple.__new__(cls, items)
+        return builtins.tuple.__new__(cls, convert(items))
+
+    @classmethod
+    def from_columns(cls, *columns):
+        """Create a list of typed tuples by zipping `columns` of items.
+
+        - Typed columns (like :class:`modeled.list` instances)
+          of matching item types are zipped without any item checks.
+        - Other columns are converted once before zipping.
+        """
+        if len(columns) != len(cls.mtypes):
+            raise TypeError("%s.from_columns() needs %d columns, not %d"
+                            % (cls.__name__, len(cls.mtypes), len(columns)))
+        columns = [
+          column if issubclass(getattr(column, 'mtype', type), mtype)
+          else [item if type(item) is mtype else mtype(item)
+                for item in column]
+          for mtype, column in zip(cls.mtypes, columns)]
+        new = builtins.tuple.__new__
+        return [new(cls, items) for items in zip(*columns)]
 
 
 def ismodeledtupleclass(cls):
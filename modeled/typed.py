@@ -19,13 +19,20 @@
 
 .. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
 """
-from six import with_metaclass
+from six import with_metaclass, exec_
 
 __all__ = ['base']
 
-from inspect import getargspec, isclass
+from inspect import isclass
+try:
+    from inspect import getfullargspec
+except ImportError:  # Python 2
+    from inspect import getargspec as getfullargspec
+
+from collections import OrderedDict
+from itertools import chain, islice
+from threading import Lock
 
-from decorator import decorator
 from moretools import cached, qualname
 
 from .base import base
@@ -84,37 +91,322 @@ class base(with_metaclass(Type, base)):
              qualname(type(value))))
 
 
-def typed(func=None, argtypes=None, returntype=None):
+def typed(func=None, argtypes=None, returntype=None, cache=None):
+    """Decorate `func` with automatic argument and return value conversion
+       to the mtypes given as annotations or as `argtypes` mapping
+       and `returntype`.
+
+    - The conversion plan is built once from the mtypes at decoration time
+      and compiled to a wrapper function with the signature of `func`,
+      converting only arguments with class mtypes.
+    - A *args mtype applies to all extra positional args
+      and a **kwargs mtype to all extra keyword args.
+    - Defaults are converted once at decoration time (if possible)
+      and are never converted again.
+    - Optionally memoizes up to `cache` results
+      of the converted args in a :class:`Cache`,
+      available as wrapper.cache.
+    """
     if func is None:
         def typed(func):
             global typed
-            return typed(func, argtypes, returntype)
+            return typed(func, argtypes, returntype, cache)
 
         return typed
 
+    spec = getfullargspec(func)
     if argtypes is not None or returntype is not None:
-        spec = getargspec(func)
         mtypes = {} if argtypes is None else dict(argtypes)
         mtypes['return'] = returntype
     else:
-        from inspect import getfullargspec
-        spec = getfullargspec(func)
-        mtypes = spec.annotations
-
-    def typed(func, *args, **kwargs):
-        iargs = iter(args)
-        args = []
-        for name, value in zip(spec.args, iargs):
-            mtype = wrapper.mtypes.get(name)
-            if isclass(mtype) and not isinstance(value, mtype):
-                value = mtype(value)
-            args.append(value)
-        result = func(*args, **kwargs)
-        mtype = wrapper.mtypes.get('return')
-        if isclass(mtype) and not isinstance(result, mtype):
-            result = mtype(result)
-        return result
-
-    wrapper = decorator(typed, func)
+        mtypes = dict(getattr(spec, 'annotations', {}))
+
+    call = func
+    if cache:
+        cache = Cache(cache)
+        call = cache(func)
+    else:
+        cache = None
+    wrapper = compile_wrapper(func, spec, dict(
+      (name, mtype) for name, mtype in mtypes.items() if isclass(mtype)),
+      call=call)
     wrapper.mtypes = mtypes
+    if cache is not None:
+        wrapper.cache = cache
+    return wrapper
+
+
+class Cache(object):
+    """Thread-safe LRU cache for the results of :func:`typed` functions.
+
+    - Keys are the converted args together with their types,
+      so equal values of different types (like 1 and 1.0)
+      don't share results.
+    - Counts hits, misses and evictions.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        self.lock = Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __call__(self, func):
+        """Get a memoizing caller of `func`.
+        """
+        results, lock = self.results, self.lock
+
+        def call(*args, **kwargs):
+            key = args + tuple(map(type, args))
+            if kwargs:
+                items = tuple(sorted(kwargs.items()))
+                key += (KWARGS, ) + items + tuple(
+                  type(value) for _, value in items)
+            hashable = True
+            with lock:
+                try:
+                    result = results.pop(key)
+                except KeyError:
+                    self.misses += 1
+                except TypeError:  # unhashable args
+                    hashable = False
+                else:
+                    results[key] = result
+                    self.hits += 1
+                    return result
+
+            # (never call func with the lock held,
+            #  which would block other threads and recursive calls)
+            result = func(*args, **kwargs)
+            if not hashable:
+                return result
+            with lock:
+                results[key] = result
+                while len(results) > self.maxsize:
+                    results.popitem(last=False)
+                    self.evictions += 1
+            return result
+
+        return call
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.results)
+
+    def __repr__(self):
+        return ('modeled.typed.Cache(maxsize=%s, size=%d, '
+                'hits=%d, misses=%d, evictions=%d)' % (
+                  self.maxsize, len(self), self.hits, self.misses,
+                  self.evictions))
+
+
+#: Separates positional and keyword args in :class:`Cache` keys
+KWARGS = object()
+
+
+def compile_wrapper(func, spec, mtypes, call=None):
+    """Generate a wrapper for `func` with the same signature,
+       which converts all args with given (class) `mtypes`
+       and passes them to `func` or an alternative `call`-able.
+    """
+    # builtins are also bound to private names,
+    #  because arg names could shadow them
+    namespace = {
+      '_func_': call or func, '_isinstance_': isinstance,
+      '_tuple_': tuple, '_dict_': dict,
+      }
+    params = []
+    callargs = []
+    lines = []
+
+    def convert(name, default=NODEFAULT):
+        mtype = mtypes.get(name)
+        if mtype is None:
+            return
+
+        namespace['_mtype_%s_' % name] = mtype
+        check = "not _isinstance_(%s, _mtype_%s_)" % (name, name)
+        if default is not NODEFAULT:
+            check = "%s is not _default_%s_ and %s" % (name, name, check)
+        lines.extend([
+          "    if %s:" % check,
+          "        %s = _mtype_%s_(%s)" % (name, name, name),
+          ])
+
+    def param(name, default=NODEFAULT):
+        if default is NODEFAULT:
+            params.append(name)
+        else:
+            mtype = mtypes.get(name)
+            if mtype is not None and not isinstance(default, mtype):
+                try:
+                    default = mtype(default)
+                except (TypeError, ValueError):
+                    pass
+            namespace['_default_%s_' % name] = default
+            params.append('%s=_default_%s_' % (name, name))
+        convert(name, default)
+
+    defaults = spec.defaults or ()
+    required = len(spec.args) - len(defaults)
+    for index, name in enumerate(spec.args):
+        param(name, defaults[index - required] if index >= required
+              else NODEFAULT)
+        callargs.append(name)
+    if spec.varargs:
+        name = spec.varargs
+        params.append('*' + name)
+        callargs.append('*' + name)
+        if name in mtypes:
+            namespace['_mtype_%s_' % name] = mtypes[name]
+            lines.append(
+              "    %s = _tuple_(_value_ if _isinstance_(_value_, _mtype_%s_)"
+              " else _mtype_%s_(_value_) for _value_ in %s)"
+              % (name, name, name, name))
+    kwonlyargs = getattr(spec, 'kwonlyargs', None) or []
+    if kwonlyargs and not spec.varargs:
+        params.append('*')
+    kwonlydefaults = getattr(spec, 'kwonlydefaults', None) or {}
+    for name in kwonlyargs:
+        param(name, kwonlydefaults.get(name, NODEFAULT))
+        callargs.append('%s=%s' % (name, name))
+    varkw = getattr(spec, 'varkw', None) or getattr(spec, 'keywords', None)
+    if varkw:
+        params.append('**' + varkw)
+        callargs.append('**' + varkw)
+        if varkw in mtypes:
+            namespace['_mtype_%s_' % varkw] = mtypes[varkw]
+            lines.append(
+              "    %s = _dict_((_key_, _value_"
+              " if _isinstance_(_value_, _mtype_%s_) else _mtype_%s_(_value_))"
+              " for _key_, _value_ in %s.items())"
+              % (varkw, varkw, varkw, varkw))
+
+    call = "_func_(%s)" % ', '.join(callargs)
+    if 'return' in mtypes:
+        namespace['_mtype_return_'] = mtypes['return']
+        lines.extend([
+          "    _result_ = %s" % call,
+          "    if _isinstance_(_result_, _mtype_return_):",
+          "        return _result_",
+          "    return _mtype_return_(_result_)",
+          ])
+    else:
+        lines.append("    return %s" % call)
+    source = '\n'.join(
+      ["def wrapper(%s):" % ', '.join(params)] + lines)
+    exec_(source, namespace)
+    wrapper = namespace['wrapper']
+    wrapper.__wrapped__ = func
+    for attr in ['__module__', '__name__', '__doc__', '__qualname__',
+                 '__annotations__']:
+        try:
+            setattr(wrapper, attr, getattr(func, attr))
+        except AttributeError:
+            pass
+    wrapper.__dict__.update(func.__dict__)
     return wrapper
+
+
+#: Marks args without default in :func:`compile_wrapper`
+NODEFAULT = object()
+
+
+#: mtypes of :func:`typed` function args,
+#  for which NumPy array columns are converted via .astype()
+BULK_TYPES = (bool, int, float, complex)
+
+
+def typedmap(func, *iterables, **options):
+    """Map a :func:`typed` `func` over columns of args from `iterables`,
+       which can also be NumPy arrays.
+
+    - Converts whole chunks of each column to the arg mtypes
+      (NumPy arrays with numeric mtypes via .astype())
+      and calls the undecorated function with the converted args.
+    - Returns a generator of results,
+      or fills and returns a preallocated `out` array (or list).
+    - Options: chunk=<size> (default 65536), out=<array>
+    """
+    if not iterables:
+        raise TypeError("typed.map() needs at least one iterable")
+
+    chunk = options.pop('chunk', 65536)
+    out = options.pop('out', None)
+    if options:
+        raise TypeError("typed.map() got unknown options %s"
+                        % ', '.join(map(repr, options)))
+
+    results = mapchunks(func, iterables, chunk)
+    if out is None:
+        return chain.from_iterable(results)
+
+    index = 0
+    for values in results:
+        out[index:index + len(values)] = values
+        index += len(values)
+    return out
+
+typed.map = typedmap
+
+
+def mapchunks(func, iterables, chunk):
+    """Iterate lists of :func:`typedmap` results per `chunk` of args.
+    """
+    call = getattr(func, '__wrapped__', func)
+    mtypes = getattr(func, 'mtypes', {})
+    cache = getattr(func, 'cache', None)
+    spec = getfullargspec(call)
+    if cache is not None:
+        call = cache(call)
+    names = spec.args[:len(iterables)]
+    names += [spec.varargs] * (len(iterables) - len(names))
+    argtypes = [mtypes.get(name) for name in names]
+    # pass the defaults, which typed() converted at decoration time,
+    #  explicitly to the undecorated function
+    defaults = getattr(func, '__defaults__', None) or ()
+    required = len(spec.args) - len(defaults)
+    extra = defaults[len(iterables) - required:] \
+      if required <= len(iterables) < len(spec.args) else ()
+    kwdefaults = getattr(func, '__kwdefaults__', None) or {}
+    returntype = mtypes.get('return')
+    if not isclass(returntype):
+        returntype = None
+
+    columns = [c if hasattr(c, 'astype') else iter(c) for c in iterables]
+    start = 0
+    while True:
+        values = [
+          column[start:start + chunk] if hasattr(column, 'astype')
+          else list(islice(column, chunk))
+          for column in columns]
+        if not all(len(v) for v in values):
+            return
+
+        start += chunk
+        values = [convertchunk(v, mtype) if isclass(mtype) else v
+                  for v, mtype in zip(values, argtypes)]
+        if extra or kwdefaults:
+            results = [call(*(args + extra), **kwdefaults)
+                       for args in zip(*values)]
+        else:
+            results = [call(*args) for args in zip(*values)]
+        if returntype is not None:
+            results = [result if isinstance(result, returntype)
+                       else returntype(result) for result in results]
+        yield results
+
+
+def convertchunk(values, mtype):
+    """Convert a chunk of `values` to `mtype`.
+    """
+    if hasattr(values, 'astype'):  # NumPy array
+        if mtype in BULK_TYPES:
+            return values.astype(mtype).tolist()
+
+        values = values.tolist()
+    return [value if isinstance(value, mtype) else mtype(value)
+            for value in values]
@@ -0,0 +1,112 @@
+"""Test :class:`modeled.cfunc` (mcfunc)
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+import ctypes
+from ctypes.util import find_library
+
+import pytest
+
+import modeled
+from modeled import mcfunc, mcarg
+
+
+@pytest.fixture(scope='module')
+def frexp():
+    """Provide a modeled.cfunc class wrapping C's frexp() from libm,
+       which returns the exponent via an out-param.
+    """
+    name = find_library('m')
+    if not name:
+        pytest.skip("libm not found")
+    cfunc = ctypes.CDLL(name).frexp
+    cfunc.restype = ctypes.c_double
+
+    class frexp(mcfunc[float, cfunc]):
+        x = mcarg[ctypes.c_double]
+        exp = mcarg[ctypes.POINTER(ctypes.c_int)]
+
+    return frexp
+
+
+def test_cfunc(frexp):
+    """Test calling modeled.cfunc classes.
+    """
+    result = frexp(8)
+    assert result.resvalue == 0.5 and result.exp == 4
+
+    plan = frexp.model.callplan
+    assert plan.names == ['x', 'exp'] and plan.outs == [1]
+
+
+def test_call(frexp):
+    """Test the lightweight call mode of modeled.cfunc classes.
+    """
+    assert frexp.call(8) == (0.5, 4)
+    assert frexp.call(x='3') == (0.75, 2)
+    with pytest.raises(modeled.CFuncArgError):
+        frexp.call()
+    with pytest.raises(TypeError):
+        frexp.call(1, 2, 3)
+
+
+def test_map(frexp):
+    """Test batch calls of modeled.cfunc classes over arg columns.
+    """
+    results, exps = frexp.map([8, 3.0, '5'])
+    assert results == [0.5, 0.75, 0.625] and exps == [4, 2, 3]
+    assert isinstance(exps, modeled.list[int])
+
+    numpy = pytest.importorskip('numpy')
+    from concurrent.futures import ThreadPoolExecutor
+
+    values = numpy.random.rand(1000) * 1000
+    mantissas, exps = numpy.frexp(values)
+    with ThreadPoolExecutor(4) as executor:
+        results, outexps = frexp.map(values, array=True, executor=executor)
+    assert numpy.allclose(results, mantissas)
+    assert (outexps == exps).all()
+
+    # NumPy columns are also checked against arg value choices
+    class choices(frexp):
+        x = mcarg[ctypes.c_double](choices=[1.0, 2.0, 4.0])
+
+    assert choices.map(numpy.array([1.0, 4.0]))[1] == [1, 3]
+    with pytest.raises(modeled.CFuncArgError):
+        choices.map(numpy.array([1.0, 3.0]))
+
+
+def test_buffer():
+    """Test zero-copy buffer args of modeled.cfunc classes.
+    """
+    name = find_library('c')
+    if not name:
+        pytest.skip("libc not found")
+    cfunc = ctypes.CDLL(name).memset
+    cfunc.restype = ctypes.c_void_p
+
+    class memset(mcfunc[cfunc]):
+        buf = mcarg[ctypes.POINTER(ctypes.c_double), mcfunc.buffer.out]
+        value = mcarg[ctypes.c_int]
+        size = mcarg[ctypes.c_size_t]
+
+    assert memset.model.callplan.outs == []
+
+    data = bytearray(b'\x01' * 16)
+    memset.call(data, 0, 8)
+    assert data == b'\x00' * 8 + b'\x01' * 8
+
+    with pytest.raises(BufferError): # not writable
+        memset.call(b'\x01' * 16, 0, 8)
+    with pytest.raises(BufferError): # no multiple of sizeof(c_double)
+        memset.call(bytearray(3), 0, 1)
+
+    numpy = pytest.importorskip('numpy')
+    array = numpy.ones(4)
+    memset(array, 0, 16)
+    assert array.tolist() == [0.0, 0.0, 1.0, 1.0]
+
+    with pytest.raises(BufferError): # not contiguous
+        memset.call(numpy.ones((4, 4))[:, 0], 0, 0)
+    with pytest.raises(BufferError): # dtype mismatch
+        memset.call(numpy.ones(4, dtype=numpy.int32), 0, 0)
@@ -42,3 +42,41 @@ def test_datetime(args):
     basic_dt = datetime(*args)
     assert mdatetime(*args) == basic_dt
     assert mdatetime(str(basic_dt)) == basic_dt
+
+
+def test_format():
+    """Test modeled.datetime[<format>] subclasses and their parsers.
+    """
+    cls = mdatetime['%Y-%m-%dT%H:%M:%S.%f']
+    assert cls is mdatetime['%Y-%m-%dT%H:%M:%S.%f']
+    assert issubclass(cls, mdatetime)
+    assert cls.format == '%Y-%m-%dT%H:%M:%S.%f'
+    assert cls('2014-01-02T03:04:05.5') \
+      == datetime(2014, 1, 2, 3, 4, 5, 500000)
+    assert cls('2014-01-02T03:04:05.123456').microsecond == 123456
+
+    assert mdatetime['%d.%m.%Y']('02.01.2014') == datetime(2014, 1, 2)
+    # missing fields default to the same values as with strptime
+    assert mdatetime['%H:%M']('12:30') \
+      == datetime.strptime('12:30', '%H:%M') == datetime(1900, 1, 1, 12, 30)
+    # not zero-padded ==> strptime fallback
+    assert mdatetime('2014-1-2 3:04:05') == datetime(2014, 1, 2, 3, 4, 5)
+    for string in ['2014-13-02 03:04:05', '+014-01-02 03:04:05',
+                   '2014-01-02T03:04:05']:
+        with pytest.raises(ValueError):
+            mdatetime(string)
+
+
+def test_parse_many():
+    """Test bulk parsing of datetime strings.
+    """
+    strings = ['2014-01-02 03:04:05', '2015-06-07 08:09:10']
+    items = mdatetime.parse_many(strings)
+    assert items == [datetime(2014, 1, 2, 3, 4, 5),
+                     datetime(2015, 6, 7, 8, 9, 10)]
+    assert all(type(item) is mdatetime for item in items)
+
+    numpy = pytest.importorskip('numpy')
+    array = mdatetime.parse_many(strings, array=True)
+    assert array.dtype == numpy.dtype('datetime64[us]')
+    assert array.tolist() == items
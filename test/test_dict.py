@@ -0,0 +1,41 @@
+"""Test :class:`modeled.dict` (mdict)
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+import pytest
+
+import modeled
+from modeled import mdict
+
+
+def test_update():
+    """Test the converting bulk update API of typed dicts.
+    """
+    cls = mdict[str, int]
+    items = cls({'a': '1'}, b=2.0)
+    assert items == {'a': 1, 'b': 2}
+
+    items.update([(3, '3')], c='4')
+    assert items == {'a': 1, 'b': 2, '3': 3, 'c': 4}
+    assert all(type(key) is str and type(value) is int
+               for key, value in items.items())
+
+    other = cls(items)
+    assert other.coerce(items) is items
+    assert other == items
+
+    assert items.setdefault('d', '5') == 5 and items['d'] == 5
+    assert items.setdefault('d', '6') == 5
+    assert cls.fromkeys([1, 2], '0') == {'1': 0, '2': 0}
+    assert type(cls.fromkeys([], 0)) is cls
+    with pytest.raises(TypeError):
+        cls.fromkeys([1]) # int(None)
+
+    merged = items | {'e': '7'}
+    assert type(merged) is cls and merged['e'] == 7
+    items |= {'f': 8.0}
+    assert type(items['f']) is int
+    assert type(items.copy()) is cls
+
+    with pytest.raises(ValueError):
+        items.update({'g': 'x'})
@@ -0,0 +1,74 @@
+"""Test :class:`modeled.list` (mlist)
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from array import array
+
+import pytest
+
+import modeled
+from modeled import mlist
+
+
+def test_mutation():
+    """Test the coercing mutation API of typed lists.
+    """
+    cls = mlist[int]
+    items = cls([1, '2'])
+    assert items == [1, 2]
+
+    items[0] = '3'
+    items[1:] = ['4', 5.0]
+    items.insert(0, '0')
+    assert items == [0, 3, 4, 5]
+    assert all(type(item) is int for item in items)
+
+    items += ('6', )
+    assert items == [0, 3, 4, 5, 6]
+    assert type(items[1:3]) is cls and items[1:3] == [3, 4]
+    assert type(items + ['7']) is cls and (items + ['7'])[-1] == 7
+    assert type(['-1'] + items) is cls and (['-1'] + items)[0] == -1
+    assert type(items * 2) is cls and type(items.copy()) is cls
+
+    other = cls([7, 8])
+    assert other.coerce(other) is other
+    items.extend(other)
+    assert items[-2:] == [7, 8]
+
+    with pytest.raises(ValueError):
+        items[0] = 'x'
+    with pytest.raises(TypeError):
+        items + ('9', )
+
+
+def test_compact():
+    """Test array.array based compact lists of numeric items.
+    """
+    cls = mlist[float].compact
+    assert cls is mlist[float].compact
+    assert issubclass(cls, array) and cls.mtype is float
+
+    items = cls([1, 2, '3.5'])
+    assert items.tolist() == [1.0, 2.0, 3.5]
+    assert memoryview(items).format == 'd'
+    assert type(items[1:]) is cls
+
+    items.extend(array('d', [4.0]))
+    items.extend(array('i', [5]))
+    items.extend(mlist[int].compact([6]))
+    items.append('7')
+    assert items.tolist() == [1.0, 2.0, 3.5, 4.0, 5.0, 6.0, 7.0]
+
+    items = mlist[int].compact([1, 2])
+    items.insert(0, '0')
+    items[1] = '5'
+    items[2:] = ['6', 7.0]
+    assert items.tolist() == [0, 5, 6, 7]
+    items += ['8']
+    assert type(items + items) is type(items * 2) is type(2 * items) \
+      is type([1] + items) is type(items)
+    assert (items + [9]).tolist() == [0, 5, 6, 7, 8, 9]
+    assert (items * 2).tolist() == [0, 5, 6, 7, 8] * 2
+
+    with pytest.raises(TypeError):
+        mlist[str].compact
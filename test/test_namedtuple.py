@@ -0,0 +1,46 @@
+"""Test :func:`modeled.namedtuple`
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+import pytest
+
+import modeled
+from modeled import namedtuple
+
+
+def test_new():
+    """Test the generated constructors of typed namedtuple classes.
+    """
+    Point = namedtuple('Point', 'x y')
+    point = Point([1, 2.5])
+    assert type(point) is Point[int, float]
+
+    cls = Point[float, int]
+    assert cls([1, '2']) == cls(x='1', y=2) == (1.0, 2)
+    assert type(cls(y=3, x=4).x) is float
+
+    with pytest.raises(TypeError):
+        cls(x=1)
+    with pytest.raises(TypeError):
+        cls([1, 2], x=1)
+    with pytest.raises(TypeError):
+        Point(x=1, y=2, z=3)
+
+    # field names don't clash with the names used by generated code
+    cls = namedtuple('Field', 'type value')[str, int]
+    assert cls(('a', '1')) == cls(type='a', value='1') == ('a', 1)
+    assert cls._make_many([('b', '2')]) == [('b', 2)]
+
+
+def test_make_many():
+    """Test bulk construction of namedtuples from rows.
+    """
+    Point = namedtuple('Point', 'x y')
+    cls = Point[float, int]
+    points = cls._make_many([(1, 2), ('3', '4')])
+    assert points == [(1.0, 2), (3.0, 4)]
+    assert all(type(point) is cls for point in points)
+
+    points = Point._make_many([(1, 'a'), (2, 'b')])
+    assert all(type(point) is Point[int, str] for point in points)
+    assert Point._make_many([]) == []
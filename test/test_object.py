@@ -0,0 +1,308 @@
+"""Test :class:`modeled.object` and its member value storage.
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+import pytest
+
+import modeled
+from modeled import mobject, m
+
+
+def test_slots():
+    """Test compact member value storage with ``slots`` model option.
+    """
+    class Compact(mobject):
+        class model:
+            slots = True
+
+        some_int = m[int](1)
+        some_float = m[float]
+
+    assert Compact.model.compact
+    assert set(Compact.__slots__) == {'_m_some_int', '_m_some_float'}
+    assert Compact.some_int.slot is Compact.__dict__['_m_some_int']
+
+    obj = Compact(some_float=2)
+    # no model instance and instancemembers yet
+    assert 'model' not in obj.__dict__
+    assert obj.some_int == 1
+    assert obj.some_float == 2.0 and type(obj.some_float) is float
+    assert 'model' not in obj.__dict__
+
+    # created on demand
+    changed = []
+    obj.m.some_int.changed.append(changed.append)
+    assert 'model' in obj.__dict__
+    assert obj.m.some_int.value == 1
+    obj.some_int = '3'
+    assert obj.some_int == 3 and changed == [3]
+
+    # option is inherited by derived classes
+    class Derived(Compact):
+        some_str = m[str]
+
+    assert Derived.model.compact
+    assert Derived.__slots__ == ('_m_some_str', )
+
+    # classes with separate member value __slots__ can't be combined
+    class Other(mobject):
+        class model:
+            slots = True
+
+        other_int = m[int](2)
+
+    with pytest.raises(TypeError) as exc:
+        mobject[Compact, Other]
+    assert 'slots' in str(exc.value)
+    # but with classes without slots
+    class Plain(mobject):
+        plain_int = m[int](3)
+
+    obj = mobject[Derived, Plain]()
+    assert obj.some_int == 1 and obj.plain_int == 3
+
+
+def test_plan():
+    """Test the cached instantiation plan of modeled classes.
+    """
+    from abc import abstractmethod
+
+    class Abstract(mobject):
+        some_int = m[int](1)
+        some_float = m[float]
+
+        @abstractmethod
+        def run(self):
+            pass
+
+    plan = Abstract.model.plan
+    assert Abstract.model.plan is plan
+    assert plan.abstractmethods == ('run', )
+    assert list(plan.members) == ['some_int', 'some_float']
+    with pytest.raises(TypeError):
+        Abstract()
+
+    class Derived(Abstract):
+        pass
+
+    with pytest.raises(TypeError):
+        Derived()
+
+    # overriding the abstract method in the base class
+    # must also invalidate the plan of the derived class
+    @Abstract.method
+    def run(self):
+        pass
+
+    assert Abstract.model.plan is not plan
+    assert not Abstract.model.plan.abstractmethods
+    assert Derived(some_float=2).some_float == 2.0
+
+
+def test_specialized_accessors():
+    """Test the generated specialized member value accessors.
+    """
+    class MClass(mobject):
+        some_int = m[int](1)
+        some_choice = m[int](1, choices=[1, 2])
+        some_strict = m[int].strict(1)
+
+    assert type(MClass.some_int) is not m[int]
+    assert isinstance(MClass.some_int, m[int])
+    assert type(MClass.some_int).__get__ is not m.__get__
+
+    obj = MClass()
+    assert obj.some_int == 1
+    obj.some_int = '2'
+    assert obj.some_int == 2
+    with pytest.raises(modeled.MemberError):
+        obj.some_choice = 3
+    with pytest.raises(TypeError):
+        obj.some_strict = '2'
+
+    # falls back to general accessor when hooks are added
+    changed = []
+    MClass.some_int.changed.append(
+      lambda obj, value: changed.append(value))
+    obj.some_int = 3
+    assert changed == [3]
+
+
+def test_build_many():
+    """Test batch creation of modeled instances.
+    """
+    changed = []
+
+    class MClass(mobject):
+        some_int = m[int](1)
+        some_float = m[float](changed=[
+          lambda obj, value: changed.append((obj, value))])
+
+    rows = [(1, '1.5'), ('2', 2)]
+    objs = MClass.model.build_many(rows)
+    assert [(obj.some_int, obj.some_float) for obj in objs] \
+        == [(1, 1.5), (2, 2.0)]
+    assert changed == [(objs[0], 1.5), (objs[1], 2.0)]
+    del changed[:]
+
+    objs = MClass.model.build_many(
+      [{'some_float': 3}], lazy=True, defer=True)
+    obj = next(objs)
+    assert obj.some_int == 1 and obj.some_float == 3.0
+    assert not changed # deferred until batch is finished
+    assert list(objs) == []
+    assert changed == [(obj, 3.0)]
+    del changed[:]
+
+    # closing a lazy batch early still calls the deferred hooks
+    objs = MClass.model.build_many(
+      [(5, 5), (6, 6)], lazy=True, defer=True)
+    obj = next(objs)
+    objs.close()
+    assert changed == [(obj, 5.0)]
+    # instances have their own instancemembers holding the values
+    assert obj.m.some_int.value == 5 and obj.m.some_int.minstance is obj
+
+    objs = MClass.model.build_many([(4, )], columns=['some_int'])
+    assert objs[0].some_int == 4
+
+
+def test_batch():
+    """Test batching of member change notifications.
+    """
+    changed = []
+
+    class MClass(mobject):
+        some_int = m[int](changed=[
+          lambda obj, value: changed.append(value)])
+        some_float = m[float]
+
+    obj = MClass()
+    obj.m.some_float.changed.append(changed.append)
+    with obj.model.batch():
+        obj.some_int = 1
+        obj.some_float = 1
+        obj.some_int = 2
+        assert not changed
+    # coalesced to the last value of each member
+    assert changed == [2, 1.0]
+
+    del changed[:]
+    other = MClass()
+    with pytest.raises(ValueError):
+        with modeled.batch(obj, other):
+            obj.some_int = 3
+            other.some_int = 4
+            raise ValueError
+    assert not changed # dropped
+    assert obj.some_int == 3 and other.some_int == 4
+
+    # repeated instances are released as well
+    with modeled.batch(obj, obj):
+        obj.some_int = 5
+    assert obj.model.batched is None
+    assert changed == [5]
+
+
+def test_changed_only_if_different():
+    """Test skipping of unchanged member values.
+    """
+    changed = []
+
+    class MClass(mobject):
+        class model:
+            changed_only_if_different = True
+
+        some_int = m[int](1)
+        some_float = m[float](changed_only_if_different=False)
+
+    obj = MClass()
+    obj.m.some_int.changed.append(changed.append)
+    obj.m.some_float.changed.append(changed.append)
+    obj.some_int = '2'
+    obj.some_int = 2
+    obj.some_float = 1
+    obj.some_float = 1
+    assert changed == [2, 1.0, 1.0]
+    assert MClass.some_int.suppressed == 1
+    assert MClass.some_float.suppressed == 0
+
+
+def test_dirty():
+    """Test dirty tracking and change journal of modeled instances.
+    """
+    class Base(mobject):
+        some_int = m[int](1)
+
+    class MClass(Base):
+        class model:
+            journal = 2
+
+        some_float = m[float]
+
+    obj = MClass()
+    assert obj.model.dirty == set()
+    obj.some_int = 2
+    obj.some_float = 1
+    obj.some_float = 2
+    assert obj.model.dirty == {'some_int', 'some_float'}
+    # bounded journal only keeps the latest changes
+    assert list(obj.model.journal) == [
+      ('some_float', None, 1.0), ('some_float', 1.0, 2.0)]
+    obj.model.clear_dirty()
+    assert not obj.model.dirty and not obj.model.journal
+
+    # instances of base class without dirty option are not tracked
+    base = Base()
+    base.some_int = 3
+    assert base.model.dirty is None
+
+    # old values of properties are journaled via their getters
+    class Props(mobject):
+        class model:
+            journal = True
+
+        _p = 50
+
+        @modeled.property[int]
+        def p(self):
+            return self._p
+
+        @p.setter
+        def p(self, value):
+            self._p = value
+
+    obj = Props()
+    obj.p = 70
+    assert list(obj.model.journal) == [('p', 50, 70)]
+
+
+def test_choices():
+    """Test hash based member value choices.
+    """
+    from modeled.member.choices import Choices
+
+    class MClass(mobject):
+        some_int = m[int](1, choices=range(100))
+        some_list = m[list]([1], choices=[[1], [2]])
+
+    choices = MClass.some_int.choices
+    assert isinstance(choices, Choices) and choices.hashed is not None
+    assert list(choices) == list(range(100))
+    assert MClass.some_list.choices.hashed is None # unhashable
+
+    obj = MClass()
+    obj.some_int = '99'
+    with pytest.raises(modeled.MemberError):
+        obj.some_int = 100
+    obj.some_list = [2]
+    with pytest.raises(modeled.MemberError):
+        obj.some_list = [3]
+
+    MClass.some_int.checkchoices([1, 2, 3])
+    with pytest.raises(modeled.MemberError):
+        MClass.some_int.checkchoices([1, 100, -1])
+    assert choices.invalid([1, 100, -1, 100]) == [100, -1]
+    assert choices.invalid(iter([1, 100])) == [100]
+    with pytest.raises(modeled.MemberError):
+        MClass.some_int.checkchoices(value for value in [1, 100])
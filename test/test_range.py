@@ -0,0 +1,142 @@
+"""Test :class:`modeled.range` (mrange)
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+import pytest
+
+import modeled
+from modeled import mrange
+
+
+def test_arithmetic():
+    """Test arithmetic length, membership and indexing.
+    """
+    items = mrange(0, 10 ** 12, 3)
+    assert len(items) == 333333333334
+    assert 999999999999 in items and 10 ** 12 not in items
+    assert items[-1] == 999999999999 and items[5] == 15
+    with pytest.raises(IndexError):
+        items[len(items)]
+
+    items = mrange(0, 10, 3)
+    assert list(items) == [0, 3, 6, 9]
+    assert list(reversed(items)) == [9, 6, 3, 0]
+    assert len(mrange.inclusive(0, 9, 3)) == 4
+    assert list(mrange(10, 0, -3)) == [10, 7, 4, 1]
+
+    sliced = mrange(0, 20, 2)[2:9:3]
+    assert isinstance(sliced, mrange[int])
+    assert list(sliced) == [4, 10, 16]
+    assert list(mrange(0, 20, 2)[8:2:-2]) == [16, 12, 8]
+
+    items = mrange(0.0, 1.0, 0.25)
+    assert len(items) == 4 and 0.75 in items and 0.8 not in items
+
+    # tuple values are compared with the whole stop tuple
+    items = mrange((0, 0.0), (3, 3.0), (1, 0.5))
+    assert list(items) == [(0, 0.0), (1, 0.5), (2, 1.0), (3, 1.5)]
+    assert len(items) == 4 and (1, 0.5) in items
+    assert len(mrange((0, 0), (2, 5), (1, 1))) == 3
+    items = mrange((0, 5), (3, 0), (1, 1))
+    assert list(items) == [(0, 5), (1, 6), (2, 7)] and len(items) == 3
+
+def test_array():
+    """Test creating NumPy arrays from ranges without iteration.
+    """
+    numpy = pytest.importorskip('numpy')
+
+    assert numpy.asarray(mrange(0, 10, 2)).tolist() == [0, 2, 4, 6, 8]
+    array = numpy.asarray(mrange((0, 0.0), (3, 3.0), (1, 0.5)))
+    assert array.shape == (4, 2)
+    assert array.tolist() == [[0, 0], [1, 0.5], [2, 1], [3, 1.5]]
+
+
+def test_split():
+    """Test partitioning ranges and mapping functions over chunks.
+    """
+    import pickle
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+    parts = mrange(0, 10).split(3)
+    assert [list(part) for part in parts] == [[0, 1, 2], [3, 4, 5],
+                                              [6, 7, 8, 9]]
+    assert all(isinstance(part, mrange[int]) for part in parts)
+    assert [list(chunk) for chunk in mrange(0, 10).chunks(4)] == [
+      [0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert [len(part) for part in mrange((0, 0), (10, 10), 1).split(3)] \
+      == [3, 3, 4]
+
+    items = mrange(0, 100, 3)
+    assert list(items.map(str)) == [str(value) for value in items]
+    with ThreadPoolExecutor(4) as executor:
+        assert list(items.map(str, executor)) \
+          == list(items.map(str, executor, chunksize=7)) \
+          == [str(value) for value in items]
+
+    # chunks of tuple ranges have modeled tuple stops
+    items = mrange((0, 0.0), (5, 5.0), (1, 0.5))
+    chunk = items[1:3]
+    assert list(pickle.loads(pickle.dumps(chunk))) == list(chunk)
+    with ProcessPoolExecutor(2) as executor:
+        assert list(items.map(str, executor)) \
+          == [str(value) for value in items]
+
+
+def test_grid():
+    """Test cartesian product grids and their vectorized arrays.
+    """
+    numpy = pytest.importorskip('numpy')
+
+    grid = mrange.grid((0, 0.0), (3, 1.0), (1, 0.5))
+    assert len(grid) == 6 and grid.shape == (3, 2)
+    assert list(grid) == [(0, 0.0), (0, 0.5), (1, 0.0),
+                          (1, 0.5), (2, 0.0), (2, 0.5)]
+    assert grid[3] == (1, 0.5) and grid[-1] == (2, 0.5)
+    assert (2, 0.5) in grid and (2, 0.7) not in grid
+
+    points = numpy.asarray(grid)
+    assert points.shape == (6, 2)
+    assert points.tolist() == [list(point) for point in grid]
+    chunks = list(grid.arrays(4))
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    assert numpy.array_equal(numpy.vstack(chunks), points)
+
+    assert [chunk.tolist() for chunk in mrange(0, 10, 2).arrays(2)] == [
+      [0, 2], [4, 6], [8]]
+
+
+def test_datetime():
+    """Test datetime ranges with timedelta and calendar steps.
+    """
+    from datetime import date, datetime, timedelta
+
+    items = mrange(datetime(2014, 1, 1), datetime(2024, 1, 1),
+                   timedelta(minutes=1))
+    assert len(items) == 5258880
+    assert items[-1] == datetime(2023, 12, 31, 23, 59)
+    assert datetime(2020, 5, 5, 3, 7) in items
+    assert datetime(2020, 5, 5, 3, 7, 1) not in items
+    assert items.index(datetime(2014, 1, 1, 0, 10)) == 10
+
+    items = mrange(modeled.datetime(2014, 1, 1),
+                   modeled.datetime(2014, 1, 1, 0, 5), timedelta(minutes=2))
+    assert list(items) == [datetime(2014, 1, 1, 0, minute)
+                           for minute in (0, 2, 4)]
+    assert all(type(item) is modeled.datetime for item in items)
+
+    items = mrange(date(2014, 1, 31), date(2015, 1, 1), modeled.months(1))
+    assert list(items)[:4] == [date(2014, 1, 31), date(2014, 2, 28),
+                               date(2014, 3, 31), date(2014, 4, 30)]
+    assert len(items) == 12 and items[-1] == date(2014, 12, 31)
+    assert items.schedule is items.schedule
+    assert date(2014, 3, 31) in items and date(2014, 3, 30) not in items
+    assert list(reversed(mrange(date(2014, 1, 1), date(2020, 1, 1),
+                                modeled.years(2)))) == [
+      date(2018, 1, 1), date(2016, 1, 1), date(2014, 1, 1)]
+
+    numpy = pytest.importorskip('numpy')
+    array = numpy.asarray(mrange(datetime(2014, 1, 1), datetime(2014, 1, 2),
+                                 timedelta(hours=1)))
+    assert array.dtype == numpy.dtype('datetime64[us]') and len(array) == 24
+    array = numpy.asarray(items)
+    assert array.dtype == numpy.dtype('datetime64[D]') and len(array) == 12
@@ -0,0 +1,60 @@
+"""Test :class:`modeled.table`,
+   the column-wise storage of modeled instances.
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+from array import array
+
+import pytest
+
+import modeled
+from modeled import mobject, m
+
+
+class Record(mobject):
+    id = m[int]
+    price = m[float](0.0)
+    name = m[str]('')
+    active = m[bool](False)
+
+
+def test_table():
+    table = modeled.table[Record]([
+      Record(id=1, price=1.5, name='one'),
+      {'id': 2, 'price': '2.5', 'active': 1},
+      # in member order: (price, name, active, id)
+      (3, 'three', False, 3),
+      ])
+    assert len(table) == 3
+    assert isinstance(table.col('price'), array)
+    assert list(table.col('price')) == [1.5, 2.5, 3.0]
+    assert table.col('name') == ['one', '', 'three']
+
+    row = table[1]
+    assert isinstance(row, Record)
+    assert row.id == 2 and row.active is True
+    row.price = '4'
+    assert table.col('price')[1] == 4.0
+    assert [row.id for row in table] == [1, 2, 3]
+    assert table[-1].name == 'three'
+
+    # instancemembers of row views go through the columns
+    row = table[0]
+    assert row.m.id.value == 1
+    row.m.name.value = 'first'
+    assert table.col('name')[0] == 'first'
+    with pytest.raises(AttributeError):
+        row.model
+
+    with pytest.raises(IndexError):
+        table[3]
+    with pytest.raises(modeled.MemberError):
+        table.append({'price': 1.0}) # id has no default
+    assert len(table) == 3
+    # values not fitting into array columns reject the whole row
+    with pytest.raises(OverflowError):
+        table.append({'id': 2 ** 64, 'name': 'big'})
+    with pytest.raises(TypeError):
+        table.append({'id': 4, 'price': None})
+    assert len(table) == 3
+    assert all(len(column) == 3 for column in table.columns.values())
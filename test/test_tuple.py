@@ -0,0 +1,33 @@
+"""Test :class:`modeled.tuple` (mtuple)
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+import pytest
+
+import modeled
+from modeled import mtuple, mlist
+
+
+def test_new():
+    """Test typed tuple creation and item conversion.
+    """
+    items = mtuple([1, 'a'])
+    assert type(items) is mtuple[int, str]
+
+    cls = mtuple[float, int]
+    items = cls([1, '2'])
+    assert items == (1.0, 2) and type(items[0]) is float
+    with pytest.raises(ValueError):
+        cls([1])
+
+
+def test_from_columns():
+    """Test bulk creation of typed tuples from columns.
+    """
+    cls = mtuple[float, int]
+    rows = cls.from_columns(mlist[float]([1.5, 2.5]), [3, '4'])
+    assert rows == [(1.5, 3), (2.5, 4)]
+    assert all(type(row) is cls and type(row[1]) is int for row in rows)
+
+    with pytest.raises(TypeError):
+        cls.from_columns([1.0])
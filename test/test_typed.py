@@ -0,0 +1,91 @@
+"""Test the :func:`modeled.typed` decorator
+
+.. moduleauthor:: Stefan Zimmermann <zimmermann.code@gmail.com>
+"""
+import pytest
+
+import modeled
+from modeled import typed
+
+
+def test_typed():
+    """Test argument and return value conversion of typed() wrappers.
+    """
+    @typed(argtypes={'x': int, 'y': float, 'args': str, 'kwargs': float},
+           returntype=list)
+    def func(x, y=1, *args, **kwargs):
+        """Some typed function.
+        """
+        return (x, y, args, kwargs)
+
+    assert func.__name__ == 'func' and 'typed' in func.__doc__
+    assert func.mtypes['x'] is int
+    assert func('1') == [1, 1.0, (), {}]
+    assert func(2, '3', 4, z='5') == [2, 3.0, ('4', ), {'z': 5.0}]
+    assert func(x='6', y=7) == [6, 7.0, (), {}]
+    with pytest.raises(ValueError):
+        func('x')
+
+    @typed(argtypes={'x': int})
+    def func(x=None):
+        return x
+
+    # non-convertible defaults are passed unconverted
+    assert func() is None and func('1') == 1
+
+
+def test_cache():
+    """Test memoizing typed() wrappers.
+    """
+    calls = []
+
+    @typed(argtypes={'x': float}, cache=2)
+    def func(x, y=0):
+        calls.append((x, y))
+        return x + y
+
+    assert func(1) == func('1') == func(1.0, y=0) == 1.0
+    assert len(calls) == 1
+    assert (func.cache.hits, func.cache.misses) == (2, 1)
+
+    # equal values of different types don't share results
+    assert func(1, True) == func(1, 1) == 2.0
+    assert len(calls) == 3
+
+    func(2)
+    assert len(func.cache) == 2 and func.cache.evictions == 2
+    func.cache.clear()
+    assert len(func.cache) == 0 and func.cache.hits == 0
+
+    # unhashable args are passed through without holding the cache lock,
+    #  so recursion through the wrapper works
+    @typed(cache=8)
+    def total(items):
+        return items[0] + total(items[1:]) if items else 0
+
+    assert total([1, 2, 3]) == 6 and len(total.cache) == 0
+
+
+def test_map():
+    """Test mapping typed() functions over columns of args.
+    """
+    @typed(argtypes={'x': float, 'y': int}, returntype=float)
+    def func(x, y):
+        return x * y
+
+    results = typed.map(func, [1, '2', 3], ['1', 2.0, 3], chunk=2)
+    assert list(results) == [1.0, 4.0, 9.0]
+
+    # with the defaults converted at decoration time
+    @typed(argtypes={'x': int, 'y': float})
+    def pair(x, y=1):
+        return x, y
+
+    assert list(typed.map(pair, ['2'])) == [pair('2')] == [(2, 1.0)]
+    assert type(next(typed.map(pair, ['2']))[1]) is float
+
+    numpy = pytest.importorskip('numpy')
+    out = numpy.zeros(3)
+    assert typed.map(func, numpy.array(['1.5', '2', '3']),
+                     numpy.array([1.0, 2.0, 3.0]), out=out) is out
+    assert out.tolist() == [1.5, 4.0, 9.0]